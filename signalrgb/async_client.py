@@ -0,0 +1,164 @@
+"""
+Asyncio client for interacting with the SignalRGB API.
+
+This module provides an asyncio-friendly wrapper around SignalRGBClient, so
+that many requests can be awaited concurrently, e.g. with asyncio.gather.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Callable, List, Optional, TypeVar
+
+from .client import DEFAULT_HOST, DEFAULT_PORT, SignalRGBClient
+from .model import CurrentState, Effect, EffectPreset, Layout
+
+T = TypeVar("T")
+
+
+class AsyncSignalRGBClient:
+    """Asyncio client for interacting with the SignalRGB API.
+
+    Each call runs the matching SignalRGBClient method in a worker thread, so
+    concurrent calls share the client's pooled keep-alive connections and
+    overlap their network round trips instead of running one after another.
+    Exceptions are the same as those raised by SignalRGBClient.
+
+    Example:
+        >>> async with AsyncSignalRGBClient() as client:
+        ...     effects = await client.get_effects()
+        ...     presets = await asyncio.gather(
+        ...         *(client.get_effect_presets(effect.id) for effect in effects)
+        ...     )
+    """
+
+    def __init__(
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        timeout: float = 10.0,
+        client: Optional[SignalRGBClient] = None,
+    ):
+        """Initialize the AsyncSignalRGBClient.
+
+        Args:
+            host: The host of the SignalRGB API. Defaults to DEFAULT_HOST.
+            port: The port of the SignalRGB API. Defaults to DEFAULT_PORT.
+            timeout: The timeout for API requests in seconds. Defaults to 10.0.
+            client: An optional SignalRGBClient to wrap instead of creating one.
+                A supplied client is left open by close().
+        """
+        # Only a client created here is closed by close()
+        self._owns_client = client is None
+        self._client = (
+            client if client is not None else SignalRGBClient(host, port, timeout)
+        )
+
+    async def _run(self, func: Callable[..., T], *args: Any) -> T:
+        """Run a blocking client call in a worker thread."""
+        return await asyncio.to_thread(func, *args)
+
+    async def get_effects(self) -> List[Effect]:
+        """List available effects."""
+        return await self._run(self._client.get_effects)
+
+    async def get_effect(self, effect_id: str) -> Effect:
+        """Get details of a specific effect."""
+        return await self._run(self._client.get_effect, effect_id)
+
+    async def get_effect_by_name(self, effect_name: str) -> Effect:
+        """Get details of a specific effect by name."""
+        return await self._run(self._client.get_effect_by_name, effect_name)
+
+    async def get_current_effect(self, details: bool = True) -> Effect:
+        """Get the current effect."""
+        return await self._run(self._client.get_current_effect, details)
+
+    async def get_current_state(self) -> CurrentState:
+        """Get the current canvas state in a single request."""
+        return await self._run(self._client.get_current_state)
+
+    async def apply_effect(self, effect_id: str) -> None:
+        """Apply an effect."""
+        await self._run(self._client.apply_effect, effect_id)
+
+    async def apply_effect_by_name(self, effect_name: str) -> Effect:
+        """Apply an effect by name."""
+        return await self._run(self._client.apply_effect_by_name, effect_name)
+
+    async def get_effect_presets(self, effect_id: str) -> List[EffectPreset]:
+        """Get presets for a specific effect."""
+        return await self._run(self._client.get_effect_presets, effect_id)
+
+    async def apply_effect_preset(self, effect_id: str, preset_id: str) -> None:
+        """Apply a preset for a specific effect."""
+        await self._run(self._client.apply_effect_preset, effect_id, preset_id)
+
+    async def get_next_effect(self) -> Optional[Effect]:
+        """Get information about the next effect in history."""
+        return await self._run(self._client.get_next_effect)
+
+    async def apply_next_effect(self) -> Effect:
+        """Apply the next effect in history."""
+        return await self._run(self._client.apply_next_effect)
+
+    async def get_previous_effect(self) -> Optional[Effect]:
+        """Get information about the previous effect in history."""
+        return await self._run(self._client.get_previous_effect)
+
+    async def apply_previous_effect(self) -> Effect:
+        """Apply the previous effect in history."""
+        return await self._run(self._client.apply_previous_effect)
+
+    async def apply_random_effect(self) -> Effect:
+        """Apply a random effect."""
+        return await self._run(self._client.apply_random_effect)
+
+    async def get_brightness(self) -> int:
+        """Get the current brightness level (0-100)."""
+        return (await self.get_current_state()).global_brightness
+
+    async def set_brightness(self, value: int) -> None:
+        """Set the brightness level (0-100)."""
+        await self._run(setattr, self._client, "brightness", value)
+
+    async def get_enabled(self) -> bool:
+        """Get the current enabled state of the canvas."""
+        return (await self.get_current_state()).enabled
+
+    async def set_enabled(self, value: bool) -> None:
+        """Enable or disable the canvas."""
+        await self._run(setattr, self._client, "enabled", value)
+
+    async def get_current_layout(self) -> Layout:
+        """Get the current layout."""
+        return await self._run(getattr, self._client, "current_layout")
+
+    async def set_current_layout(self, layout_id: str) -> None:
+        """Set the current layout."""
+        await self._run(setattr, self._client, "current_layout", layout_id)
+
+    async def get_layouts(self) -> List[Layout]:
+        """Get all available layouts."""
+        return await self._run(self._client.get_layouts)
+
+    def refresh_effects(self) -> None:
+        """Refresh the cached effects."""
+        self._client.refresh_effects()
+
+    async def close(self) -> None:
+        """Close the underlying client and release its pooled connections.
+
+        A client passed in by the caller is left open for the caller to close.
+        """
+        if self._owns_client:
+            self._client.close()
+
+    async def __aenter__(self) -> AsyncSignalRGBClient:
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return f"AsyncSignalRGBClient(client={self._client!r})"
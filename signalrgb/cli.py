@@ -1,17 +1,21 @@
+from __future__ import annotations
+
 import time
-from functools import wraps
-from typing import List, Optional, Tuple
+from functools import lru_cache, wraps
+from itertools import islice
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Iterable, List, Optional, Sequence, Tuple
 
 import typer
 from rich import box
-from rich.columns import Columns
 from rich.console import Console, ConsoleOptions, Group, RenderResult
-from rich.panel import Panel
-from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+from rich.markup import escape
 from rich.table import Table
-from rich.text import Text
+from rich.text import Span, Text
 
 from .client import (
+    DEFAULT_HOST,
+    DEFAULT_PORT,
     APIError,
     ConnectionError,
     NotFoundError,
@@ -19,34 +23,53 @@
     SignalRGBException,
 )
 
+if TYPE_CHECKING:
+    from rich.measure import Measurement
+    from rich.panel import Panel
+
+# rich.columns, rich.panel and rich.progress are imported where they are used
+# so commands that only print a line don't pay for them at startup
+
 PANEL_WIDTH = 100
 
 app = typer.Typer(help="SignalRGB CLI")
 console = Console()
 
-ICONS = {
-    "effect": "🌠",
-    "preset": "🎨",
-    "layout": "🖼️",
-    "canvas": "🖥️",
-    "audio": "🎵",
-    "video": "🎬",
-    "input": "🕹️",
-    "meters": "📊",
-}
+ICONS = MappingProxyType(
+    {
+        "effect": "🌠",
+        "preset": "🎨",
+        "layout": "🖼️",
+        "canvas": "🖥️",
+        "audio": "🎵",
+        "video": "🎬",
+        "input": "🕹️",
+        "meters": "📊",
+    }
+)
 
-STATUS_EMOJIS = {
-    "enabled": "✨",
-    "disabled": "🌑",
-    "warning": "⚠️",
-    "error": "🚫",
-}
+STATUS_EMOJIS = MappingProxyType(
+    {
+        "enabled": "✨",
+        "disabled": "🌑",
+        "warning": "⚠️",
+        "error": "🚫",
+    }
+)
+
+# Capability rows shown in the effect panel, as (label, attribute name)
+CAPABILITY_FIELDS = (
+    ("Uses Audio", "uses_audio"),
+    ("Uses Video", "uses_video"),
+    ("Uses Input", "uses_input"),
+    ("Uses Meters", "uses_meters"),
+)
 
 # Global variable to track Full RGB mode
 FULL_RGB_MODE = False
 
 # RGB Gradient colors for full RGB mode
-GRADIENT_COLORS = [
+GRADIENT_COLORS = (
     "#ff99cc",
     "#ff66b2",
     "#ff4da6",
@@ -69,7 +92,11 @@
     "#ff6633",
     "#ff3333",
     "#ff3366",
-]
+)
+
+# Number of steps in the precomputed gradient ring; kept small enough that
+# short labels still span several palette colors
+GRADIENT_RING_SIZE = 128
 
 # Color palette for normal mode
 NORMAL_PALETTE = {
@@ -88,16 +115,48 @@
     "error": "bright_red",
 }
 
+# Frequently used palette entries, bound once
+TITLE_STYLE = NORMAL_PALETTE["title"]
+SECONDARY_STYLE = NORMAL_PALETTE["secondary"]
+LABEL_STYLE = NORMAL_PALETTE["label"]
+VALUE_STYLE = NORMAL_PALETTE["value"]
+PARAMETER_STYLE = NORMAL_PALETTE["parameter"]
+PARAMETER_VALUE_STYLE = NORMAL_PALETTE["parameter_value"]
+BORDER_STYLE = NORMAL_PALETTE["border"]
+
 # Purple color for table borders
 BORDER_COLOR = "purple"
 
+# Table options shared by every colorful table
+COLORFUL_TABLE_OPTIONS = {
+    "box": box.ROUNDED,
+    "show_header": True,
+    "header_style": "bold magenta",
+    "border_style": BORDER_COLOR,
+}
+
+# Labels for errors reported by handle_exceptions
+ERROR_LABELS = {
+    ConnectionError: "Connection Error",
+    APIError: "API Error",
+    NotFoundError: "Not Found",
+    SignalRGBException: "Error",
+}
+
+# Column headers shared by the list commands
+EFFECT_COLUMNS = ("Name", "ID")
+SEARCH_COLUMNS = ("Name", "Description")
+PRESET_COLUMNS = ("Preset",)
+LAYOUT_COLUMNS = ("Layout ID",)
+CANVAS_COLUMNS = ("Property", "Value")
+
 
 class FlexibleTable(Table):
     """A Table that adjusts its width based on the console width."""
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.original_width = kwargs.get("width")
+        self.original_width = kwargs.get("width") or PANEL_WIDTH
 
     def __rich_console__(
         self, console: Console, options: ConsoleOptions
@@ -105,40 +164,79 @@ def __rich_console__(
         self.width = min(self.original_width, options.max_width)
         yield from super().__rich_console__(console, options)
 
+    def __rich_measure__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Measurement:
+        self.width = min(self.original_width, options.max_width)
+        return super().__rich_measure__(console, options)
+
 
-def generate_gradient_markup(colors: List[str], steps: int) -> List[str]:
-    """Generate a list of color codes for gradient effect."""
+@lru_cache(maxsize=None)
+def hex_to_rgb(color: str) -> Tuple[int, int, int]:
+    """Convert a '#rrggbb' color string to an (r, g, b) tuple."""
+    return int(color[1:3], 16), int(color[3:5], 16), int(color[5:7], 16)
+
+
+@lru_cache(maxsize=512)
+def _gradient(colors: Tuple[str, ...], steps: int) -> Tuple[str, ...]:
+    """Compute and cache the gradient for a palette and step count."""
     gradient = []
     segments = len(colors) - 1
     steps_per_segment = max(1, steps // segments)
+    rgb = [hex_to_rgb(color) for color in colors]
 
-    for i in range(segments):
-        start_color = colors[i]
-        end_color = colors[i + 1]
+    for (r1, g1, b1), (r2, g2, b2) in zip(rgb, rgb[1:]):
         for j in range(steps_per_segment):
             t = j / steps_per_segment
-            r = int(int(start_color[1:3], 16) * (1 - t) + int(end_color[1:3], 16) * t)
-            g = int(int(start_color[3:5], 16) * (1 - t) + int(end_color[3:5], 16) * t)
-            b = int(int(start_color[5:7], 16) * (1 - t) + int(end_color[5:7], 16) * t)
+            r = int(r1 * (1 - t) + r2 * t)
+            g = int(g1 * (1 - t) + g2 * t)
+            b = int(b1 * (1 - t) + b2 * t)
             gradient.append(f"#{r:02x}{g:02x}{b:02x}")
 
-    return gradient
+    return tuple(gradient)
 
 
-def apply_gradient_to_text(text: str, colors: List[str], line_offset: int = 0) -> Text:
-    """Apply gradient coloring to text using Rich's Text object."""
-    gradient = generate_gradient_markup(colors, len(text))
-    styled_text = Text()
+def generate_gradient_markup(colors: Sequence[str], steps: int) -> List[str]:
+    """Generate a list of color codes for gradient effect."""
+    return list(_gradient(tuple(colors), steps))
 
-    for i, char in enumerate(text):
-        color = gradient[(i + line_offset) % len(gradient)]
-        styled_text.append(char, style=f"{color}")
 
-    return styled_text
+# Precomputed gradient ring shared by all styled text
+GRADIENT_RING = _gradient(GRADIENT_COLORS, GRADIENT_RING_SIZE)
 
 
-def color_gradient(text: str, colors: List[str], line_number: int = 0) -> Text:
+@lru_cache(maxsize=4096)
+def _gradient_spans(
+    gradient: Tuple[str, ...], length: int, line_offset: int
+) -> Tuple[Span, ...]:
+    """Compute and cache the per-character spans for a text length and offset.
+
+    Spans only depend on the text's length, not its content, so cells and
+    lines of the same length share one entry.
+    """
+    # Rotate and repeat once so the per-character loop needs no modulo
+    rotated = gradient[line_offset:] + gradient[:line_offset]
+    colors = (rotated * (length // len(rotated) + 1))[:length]
+    return tuple(Span(i, i + 1, color) for i, color in enumerate(colors))
+
+
+def apply_gradient_to_text(
+    text: str, colors: Sequence[str], line_offset: int = 0
+) -> Text:
+    """Apply gradient coloring to text using Rich's Text object."""
+    if colors is GRADIENT_COLORS:
+        gradient = GRADIENT_RING
+    else:
+        gradient = _gradient(tuple(colors), GRADIENT_RING_SIZE)
+    spans = _gradient_spans(gradient, len(text), line_offset % len(gradient))
+    # Text owns and mutates its span list, so hand it a fresh copy
+    return Text(text, spans=list(spans))
+
+
+def color_gradient(text: str, colors: Sequence[str], line_number: int = 0) -> Text:
     """Apply color gradient or normal coloring based on mode."""
+    if not FULL_RGB_MODE:
+        return Text(text, style=TITLE_STYLE)
     return apply_gradient_to_text(text, colors, line_number)
 
 
@@ -151,9 +249,66 @@ def print_rgb(message: str, style: str = "primary"):
         console.print(message, style=NORMAL_PALETTE[style])
 
 
+# Backslash escapes for characters that would split a piped record or field
+RECORD_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def print_records(rows: Iterable[Sequence[str]]) -> None:
+    """Print rows as plain tab-separated records.
+
+    Used instead of panels and tables when output is not a terminal, so piped
+    output is grep/awk friendly and skips Rich's layout pass entirely. Tabs,
+    newlines, carriage returns and backslashes inside fields are written as
+    backslash escapes, so every row stays on one line.
+    """
+    # Written straight to the file, since Rich would expand the tabs
+    console.file.write(
+        "".join(
+            "\t".join(field.translate(RECORD_ESCAPES) for field in row) + "\n"
+            for row in rows
+        )
+    )
+
+
+def print_table(
+    title: str, headers: Sequence[str], rows: Iterable[Sequence[str]]
+) -> None:
+    """Print rows as a colorful table, or as plain records when piped."""
+    if not console.is_terminal:
+        print_records(rows)
+        return
+    console.print(create_colorful_table(title, headers, rows))
+
+
+def print_info(content: str, title: str) -> None:
+    """Print a compact info panel, or just its content when piped."""
+    if not console.is_terminal:
+        print_records([(content,)])
+        return
+    console.print(create_info_panel(content, title))
+
+
+class ClientFactory:
+    """Create the SignalRGB client on first use and reuse it afterwards.
+
+    Stored on the Typer context so that help output and argument errors
+    never construct a client.
+    """
+
+    def __init__(self, host: str, port: int):
+        self.host = host
+        self.port = port
+        self._client: Optional[SignalRGBClient] = None
+
+    def __call__(self) -> SignalRGBClient:
+        if self._client is None:
+            self._client = SignalRGBClient(self.host, self.port)
+        return self._client
+
+
 def get_client(ctx: typer.Context) -> SignalRGBClient:
     """Get the SignalRGB client from the Typer context."""
-    return ctx.obj
+    return ctx.obj()
 
 
 def handle_exceptions(func):
@@ -163,42 +318,39 @@ def handle_exceptions(func):
     def wrapper(*args, **kwargs):
         try:
             return func(*args, **kwargs)
-        except ConnectionError as e:
-            print_rgb(f"{STATUS_EMOJIS['error']} Connection Error: {str(e)}", "error")
-            raise typer.Exit(code=1)
-        except APIError as e:
-            print_rgb(f"{STATUS_EMOJIS['error']} API Error: {str(e)}", "error")
-            raise typer.Exit(code=1)
-        except NotFoundError as e:
-            print_rgb(f"{STATUS_EMOJIS['error']} Not Found: {str(e)}", "error")
-            raise typer.Exit(code=1)
         except SignalRGBException as e:
-            print_rgb(f"{STATUS_EMOJIS['error']} Error: {str(e)}", "error")
+            print_rgb(f"{STATUS_EMOJIS['error']} {error_label(e)}: {str(e)}", "error")
             raise typer.Exit(code=1)
 
     return wrapper
 
 
+def error_label(error: SignalRGBException) -> str:
+    """Get the label shown for an error, matching the closest known base class."""
+    for cls in type(error).__mro__:
+        if cls in ERROR_LABELS:
+            return ERROR_LABELS[cls]
+    return "Error"
+
+
 def get_column_widths(items):
     """Calculate column widths based on content."""
-    max_label_width = max(len(key) for key, _ in items)
-    label_column_width = max(max_label_width, 20)  # Minimum width of 20 characters
+    # Minimum width of 20 characters, also used when there are no items
+    label_column_width = max(20, max((len(key) for key, _ in items), default=0))
     value_column_width = (
         (PANEL_WIDTH // 2) - label_column_width - 4
     )  # 4 for padding and separators
     return label_column_width, value_column_width
 
 
-def create_section(content: List[Tuple[str, str]], width: int) -> FlexibleTable:
+def create_section(content: Sequence[Tuple[str, str]], width: int) -> FlexibleTable:
     label_column_width, value_column_width = get_column_widths(content)
 
     table = FlexibleTable(
         show_header=False, padding=(0, 1), expand=False, box=None, width=width
     )
-    table.add_column(
-        style=NORMAL_PALETTE["label"], width=label_column_width, no_wrap=True
-    )
-    table.add_column(style=NORMAL_PALETTE["value"], width=value_column_width)
+    table.add_column(style=LABEL_STYLE, width=label_column_width, no_wrap=True)
+    table.add_column(style=VALUE_STYLE, width=value_column_width)
 
     for i, (label, value) in enumerate(content):
         if FULL_RGB_MODE:
@@ -208,55 +360,59 @@ def create_section(content: List[Tuple[str, str]], width: int) -> FlexibleTable:
     return table
 
 
+def bool_emoji(flag: bool) -> str:
+    """Return the enabled or disabled status emoji for a flag."""
+    return STATUS_EMOJIS["enabled"] if flag else STATUS_EMOJIS["disabled"]
+
+
+@lru_cache(maxsize=256)
+def effect_panel_rows(
+    effect_id: str,
+    name: str,
+    publisher: Optional[str],
+    capabilities: Tuple[bool, ...],
+) -> Tuple[Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]:
+    """Build the info and capabilities rows for an effect panel.
+
+    The rows only depend on a handful of scalar effect fields, so they are
+    memoized to avoid re-formatting the same effect in tight loops.
+    """
+    info = (
+        ("ID", effect_id),
+        ("Name", name),
+        ("Publisher", publisher or "N/A"),
+    )
+    capability_rows = tuple(
+        (label, bool_emoji(flag))
+        for (label, _), flag in zip(CAPABILITY_FIELDS, capabilities)
+    )
+    return info, capability_rows
+
+
 def create_effect_panel(effect, title: str) -> Panel:
     """Create a panel displaying effect details with an enhanced layout."""
-
-    # Info Section
-    info = create_section(
-        [
-            ("ID", effect.id),
-            ("Name", effect.attributes.name),
-            ("Publisher", effect.attributes.publisher or "N/A"),
-        ],
-        PANEL_WIDTH // 2,  # Set width to half the panel width
+    from rich.columns import Columns
+    from rich.panel import Panel
+
+    attributes = effect.attributes
+    info_rows, capability_rows = effect_panel_rows(
+        effect.id,
+        attributes.name,
+        attributes.publisher,
+        tuple(getattr(attributes, field) for _, field in CAPABILITY_FIELDS),
     )
 
+    # Info Section, half the panel width
+    info = create_section(info_rows, PANEL_WIDTH // 2)
+
     # Capabilities Section
-    capabilities = create_section(
-        [
-            (
-                "Uses Audio",
-                STATUS_EMOJIS["enabled"]
-                if effect.attributes.uses_audio
-                else STATUS_EMOJIS["disabled"],
-            ),
-            (
-                "Uses Video",
-                STATUS_EMOJIS["enabled"]
-                if effect.attributes.uses_video
-                else STATUS_EMOJIS["disabled"],
-            ),
-            (
-                "Uses Input",
-                STATUS_EMOJIS["enabled"]
-                if effect.attributes.uses_input
-                else STATUS_EMOJIS["disabled"],
-            ),
-            (
-                "Uses Meters",
-                STATUS_EMOJIS["enabled"]
-                if effect.attributes.uses_meters
-                else STATUS_EMOJIS["disabled"],
-            ),
-        ],
-        (PANEL_WIDTH // 2) - 5,
-    )
+    capabilities = create_section(capability_rows, (PANEL_WIDTH // 2) - 5)
 
     # Combine info and capabilities side by side
     top_section = Columns([info, capabilities], expand=True)
 
     # Description Section
-    description = effect.attributes.description or "N/A"
+    description = attributes.description or "N/A"
     if FULL_RGB_MODE:
         description = apply_gradient_to_text(description, GRADIENT_COLORS)
 
@@ -267,32 +423,47 @@ def create_effect_panel(effect, title: str) -> Panel:
         content,
         title=color_gradient(f"{ICONS['effect']} {title}", GRADIENT_COLORS),
         expand=False,
-        border_style=NORMAL_PALETTE["border"],
+        border_style=BORDER_STYLE,
         width=PANEL_WIDTH,
     )
 
 
+def create_info_panel(content: str, title: str) -> Panel:
+    """Create a compact panel showing a single line of information."""
+    from rich.panel import Panel
+
+    if FULL_RGB_MODE:
+        content = apply_gradient_to_text(content, GRADIENT_COLORS)
+    return Panel(
+        content,
+        title=color_gradient(title, GRADIENT_COLORS),
+        expand=False,
+        border_style=BORDER_COLOR,
+    )
+
+
 def create_param_table(parameters):
     """Create a table displaying effect parameters with enhanced layout."""
+    from rich.columns import Columns
+    from rich.panel import Panel
+
     label_column_width, value_column_width = get_column_widths(parameters.items())
 
     table = FlexibleTable(
         box=None, show_header=False, expand=False, width=PANEL_WIDTH // 2
     )
 
-    table.add_column(
-        style=NORMAL_PALETTE["parameter"], width=label_column_width, no_wrap=True
-    )
-    table.add_column(style=NORMAL_PALETTE["parameter_value"], width=value_column_width)
+    table.add_column(style=PARAMETER_STYLE, width=label_column_width, no_wrap=True)
+    table.add_column(style=PARAMETER_VALUE_STYLE, width=value_column_width)
 
-    param_items = list(parameters.items())
-    mid_point = len(param_items) // 2 + len(param_items) % 2
+    count = len(parameters)
+    mid_point = count // 2 + count % 2
 
-    for i, (key, value) in enumerate(param_items[:mid_point]):
+    for i, (key, value) in enumerate(islice(parameters.items(), mid_point)):
         label, formatted_value = format_parameter(key, value)
         if FULL_RGB_MODE:
             label = apply_gradient_to_text(label, GRADIENT_COLORS, line_offset=i)
-            if "■■■■" not in formatted_value:
+            if not isinstance(formatted_value, Text):
                 formatted_value = apply_gradient_to_text(
                     formatted_value, GRADIENT_COLORS, line_offset=i
                 )
@@ -302,13 +473,33 @@ def create_param_table(parameters):
         Columns([table], expand=True, equal=True),
         title=color_gradient(f"{ICONS['effect']} Parameters", GRADIENT_COLORS),
         expand=False,
-        border_style=NORMAL_PALETTE["border"],
+        border_style=BORDER_STYLE,
         width=PANEL_WIDTH,
     )
 
     return param_panel
 
 
+def effect_records(effect) -> List[Tuple[str, str]]:
+    """Build the plain (label, value) records describing an effect."""
+    attributes = effect.attributes
+    info_rows, capability_rows = effect_panel_rows(
+        effect.id,
+        attributes.name,
+        attributes.publisher,
+        tuple(getattr(attributes, field) for _, field in CAPABILITY_FIELDS),
+    )
+    records = [*info_rows, *capability_rows]
+    records.append(("Description", attributes.description or "N/A"))
+    for key, value in (attributes.parameters or {}).items():
+        label, formatted_value = format_parameter(key, value)
+        if isinstance(formatted_value, Text):
+            # Color swatches carry the color itself as their style
+            formatted_value = str(formatted_value.style)
+        records.append((label, formatted_value))
+    return records
+
+
 def format_parameter(key, value):
     """Format parameter based on its structure."""
     if isinstance(value, dict) and "label" in value and "value" in value:
@@ -320,7 +511,7 @@ def format_parameter_value(value, param_type=None):
     if isinstance(value, bool):
         return "Yes" if value else "No"
     elif param_type == "color":
-        return f"[{value}]■■■■[/]"  # Display a colored square
+        return Text("■■■■", style=value)  # Display a colored square
     elif isinstance(value, (int, float)):
         return str(value)
     elif isinstance(value, str):
@@ -333,28 +524,30 @@ def format_parameter_value(value, param_type=None):
         return str(value)
 
 
-def create_colorful_table(title: str, headers: List[str], rows: List[List[str]]):
+def create_colorful_table(
+    title: str, headers: Sequence[str], rows: Iterable[Sequence[str]]
+) -> Table:
     """Create a colorful table with the given title, headers, and rows."""
     table = Table(
-        title=color_gradient(title, GRADIENT_COLORS),
-        box=box.ROUNDED,
-        show_header=True,
-        header_style="bold magenta",
-        border_style=BORDER_COLOR,
+        title=color_gradient(title, GRADIENT_COLORS), **COLORFUL_TABLE_OPTIONS
     )
 
+    # Style whole columns once; gradient cells carry their own styles
+    column_style = None if FULL_RGB_MODE else SECONDARY_STYLE
     for header in headers:
-        table.add_column(header)
+        table.add_column(header, style=column_style)
 
-    for i, row in enumerate(rows):
-        styled_row = []
-        for cell in row:
-            if FULL_RGB_MODE:
-                cell_text = apply_gradient_to_text(cell, GRADIENT_COLORS, line_offset=i)
-            else:
-                cell_text = Text(cell, style=NORMAL_PALETTE["secondary"])
-            styled_row.append(cell_text)
-        table.add_row(*styled_row)
+    if FULL_RGB_MODE:
+        for i, row in enumerate(rows):
+            table.add_row(
+                *[
+                    apply_gradient_to_text(cell, GRADIENT_COLORS, line_offset=i)
+                    for cell in row
+                ]
+            )
+    else:
+        for row in rows:
+            table.add_row(*[escape(cell) for cell in row])
 
     return table
 
@@ -373,9 +566,13 @@ def effect(ctx: typer.Context, name: Optional[str] = None):
         effect = (
             client.get_effect_by_name(name) if name else client.get_current_effect()
         )
-        console.print(create_effect_panel(effect, f"{effect.attributes.name}"))
+        if not console.is_terminal:
+            print_records(effect_records(effect))
+            return
+        renderables = [create_effect_panel(effect, f"{effect.attributes.name}")]
         if effect.attributes.parameters:
-            console.print(create_param_table(effect.attributes.parameters))
+            renderables.append(create_param_table(effect.attributes.parameters))
+        console.print(Group(*renderables))
 
 
 @effect_app.command(name="list")
@@ -385,11 +582,8 @@ def list_effects(ctx: typer.Context):
     client = get_client(ctx)
     effects = client.get_effects()
 
-    rows = [[e.attributes.name, e.id] for e in effects]
-    table = create_colorful_table(
-        f"{ICONS['effect']} Available Effects", ["Name", "ID"], rows
-    )
-    console.print(table)
+    rows = ((e.attributes.name, e.id) for e in effects)
+    print_table(f"{ICONS['effect']} Available Effects", EFFECT_COLUMNS, rows)
 
 
 @effect_app.command()
@@ -398,22 +592,17 @@ def search(ctx: typer.Context, query: str):
     """Search for effects by name or description."""
     client = get_client(ctx)
     effects = client.get_effects()
-    matched_effects = [
-        e
+    query_folded = query.casefold()
+    # Filter and build rows in a single streaming pass
+    rows = (
+        (e.attributes.name, e.attributes.description or "N/A")
         for e in effects
-        if query.lower() in e.attributes.name.lower()
-        or (
-            e.attributes.description
-            and query.lower() in e.attributes.description.lower()
-        )
-    ]
-    rows = [
-        [e.attributes.name, e.attributes.description or "N/A"] for e in matched_effects
-    ]
-    table = create_colorful_table(
-        f"{ICONS['effect']} Search Results for '{query}'", ["Name", "Description"], rows
+        if query_folded in e.attributes.name_folded
+        or query_folded in e.attributes.description_folded
+    )
+    print_table(
+        f"{ICONS['effect']} Search Results for '{query}'", SEARCH_COLUMNS, rows
     )
-    console.print(table)
 
 
 @effect_app.command(name="apply")
@@ -421,9 +610,9 @@ def search(ctx: typer.Context, query: str):
 def apply_effect(ctx: typer.Context, name: str, preset: Optional[str] = None):
     """Apply an effect, optionally with a preset."""
     client = get_client(ctx)
-    client.apply_effect_by_name(name)
+    effect = client.apply_effect_by_name(name)
     if preset:
-        client.apply_effect_preset(client.get_effect_by_name(name).id, preset)
+        client.apply_effect_preset(effect.id, preset)
     print_rgb(
         f"{ICONS['effect']} Applied effect: {name}"
         + (f" with preset: {preset}" if preset else ""),
@@ -464,6 +653,20 @@ def random(ctx: typer.Context):
     )
 
 
+def apply_on_schedule(client: SignalRGBClient, effects, duration: float):
+    """Apply each effect in turn, yielding it once applied.
+
+    Schedules against a monotonic deadline so request latency is absorbed
+    into each effect's display time instead of adding to it.
+    """
+    deadline = time.monotonic()
+    for effect in effects:
+        client.apply_effect(effect.id)
+        yield effect
+        deadline += duration
+        time.sleep(max(0.0, deadline - time.monotonic()))
+
+
 @effect_app.command()
 @handle_exceptions
 def cycle(
@@ -473,22 +676,27 @@ def cycle(
     """Cycle through all effects."""
     client = get_client(ctx)
     effects = client.get_effects()
-    with Progress(
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(complete_style="green", finished_style="bright_green"),
-        TimeRemainingColumn(),
-    ) as progress:
-        task = progress.add_task(
-            f"{ICONS['effect']} Cycling effects...", total=len(effects)
-        )
-        for effect in effects:
-            client.apply_effect(effect.id)
-            progress.update(
-                task,
-                advance=1,
-                description=f"{ICONS['effect']} Applied: {effect.attributes.name}",
+    descriptions = [f"{ICONS['effect']} Applied: {e.attributes.name}" for e in effects]
+    applied = apply_on_schedule(client, effects, duration)
+
+    if not console.is_terminal:
+        # No live display when piped, just one line per applied effect
+        for _, description in zip(applied, descriptions):
+            print_rgb(description, "info")
+    else:
+        from rich.progress import BarColumn, Progress, TextColumn, TimeRemainingColumn
+
+        with Progress(
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(complete_style="green", finished_style="bright_green"),
+            TimeRemainingColumn(),
+            refresh_per_second=4,
+        ) as progress:
+            task = progress.add_task(
+                f"{ICONS['effect']} Cycling effects...", total=len(effects)
             )
-            time.sleep(duration)
+            for _, description in zip(applied, descriptions):
+                progress.update(task, advance=1, description=description)
     print_rgb(f"{ICONS['effect']} Finished cycling through all effects", "accent")
 
 
@@ -515,20 +723,11 @@ def preset(ctx: typer.Context, name: Optional[str] = None):
         current_effect = client.get_current_effect()
         presets = client.get_effect_presets(current_effect.id)
         if name:
-            preset = next((p for p in presets if p.id == name), None)
+            presets_by_id = {p.id: p for p in presets}
+            preset = presets_by_id.get(name)
             if preset:
-                content = f"Preset: {preset.id}"
-                if FULL_RGB_MODE:
-                    content = apply_gradient_to_text(content, GRADIENT_COLORS)
-                console.print(
-                    Panel(
-                        content,
-                        title=color_gradient(
-                            f"{ICONS['preset']} Preset Information", GRADIENT_COLORS
-                        ),
-                        expand=False,
-                        border_style=BORDER_COLOR,
-                    )
+                print_info(
+                    f"Preset: {preset.id}", f"{ICONS['preset']} Preset Information"
                 )
 
 @preset_app.command(name="list")
@@ -538,13 +737,9 @@ def list_presets(ctx: typer.Context):
     client = get_client(ctx)
     current_effect = client.get_current_effect()
     presets = client.get_effect_presets(current_effect.id)
-    rows = [[p.id] for p in presets]
-    table = create_colorful_table(
-        f"{ICONS['preset']} Presets for {current_effect.attributes.name}",
-        ["Preset"],
-        rows,
-    )
-    console.print(table)
+    title = f"{ICONS['preset']} Presets for {current_effect.attributes.name}"
+    rows = ((p.id,) for p in presets)
+    print_table(title, PRESET_COLUMNS, rows)
 
 
 @preset_app.command(name="apply")
@@ -572,21 +767,11 @@ def layout(ctx: typer.Context, name: Optional[str] = None):
     if ctx.invoked_subcommand is None:
         client = get_client(ctx)
         if name:
-            layouts = client.get_layouts()
-            layout = next((ll for ll in layouts if ll.id == name), None)
+            layouts_by_id = {ll.id: ll for ll in client.get_layouts()}
+            layout = layouts_by_id.get(name)
             if layout:
-                content = f"Layout: {layout.id}"
-                if FULL_RGB_MODE:
-                    content = apply_gradient_to_text(content, GRADIENT_COLORS)
-                console.print(
-                    Panel(
-                        content,
-                        title=color_gradient(
-                            f"{ICONS['layout']} Layout Information", GRADIENT_COLORS
-                        ),
-                        expand=False,
-                        border_style=BORDER_COLOR,
-                    )
+                print_info(
+                    f"Layout: {layout.id}", f"{ICONS['layout']} Layout Information"
                 )
             else:
                 print_rgb(
@@ -595,18 +780,9 @@ def layout(ctx: typer.Context, name: Optional[str] = None):
                 raise typer.Exit(code=1)
         else:
             current_layout = client.current_layout
-            content = f"Current Layout: {current_layout.id}"
-            if FULL_RGB_MODE:
-                content = apply_gradient_to_text(content, GRADIENT_COLORS)
-            console.print(
-                Panel(
-                    content,
-                    title=color_gradient(
-                        f"{ICONS['layout']} Layout Information", GRADIENT_COLORS
-                    ),
-                    expand=False,
-                    border_style=BORDER_COLOR,
-                )
+            print_info(
+                f"Current Layout: {current_layout.id}",
+                f"{ICONS['layout']} Layout Information",
             )
 
 @layout_app.command(name="list")
@@ -615,11 +791,8 @@ def list_layouts(ctx: typer.Context):
     """List all available layouts."""
     client = get_client(ctx)
     layouts = client.get_layouts()
-    rows = [[layout.id] for layout in layouts]
-    table = create_colorful_table(
-        f"{ICONS['layout']} Available Layouts", ["Layout ID"], rows
-    )
-    console.print(table)
+    rows = ((layout.id,) for layout in layouts)
+    print_table(f"{ICONS['layout']} Available Layouts", LAYOUT_COLUMNS, rows)
 
 
 @layout_app.command()
@@ -645,8 +818,10 @@ def canvas(ctx: typer.Context):
     """Show current canvas state."""
     if ctx.invoked_subcommand is None:
         client = get_client(ctx)
-        enabled = client.enabled
-        brightness = client.brightness
+        # Both values come from the same endpoint, so fetch the state once
+        state = client.get_current_state()
+        enabled = state.enabled
+        brightness = state.global_brightness
 
         # Prepare the data to be displayed in the table
         status = STATUS_EMOJIS["enabled"] if enabled else STATUS_EMOJIS["disabled"]
@@ -655,15 +830,7 @@ def canvas(ctx: typer.Context):
             ["Brightness", f"{brightness}%"],
         ]
 
-        # Use create_colorful_table to create the table
-        table = create_colorful_table(
-            f"{ICONS['canvas']} Canvas Information",
-            headers=["Property", "Value"],
-            rows=rows,
-        )
-
-        # Print the table in a panel
-        console.print(table)
+        print_table(f"{ICONS['canvas']} Canvas Information", CANVAS_COLUMNS, rows)
 
 
 @canvas_app.command()
@@ -705,17 +872,18 @@ def disable(ctx: typer.Context):
 def toggle(ctx: typer.Context):
     """Toggle the canvas enabled state."""
     client = get_client(ctx)
-    client.enabled = not client.enabled
-    status = "enabled" if client.enabled else "disabled"
-    emoji = STATUS_EMOJIS["enabled"] if client.enabled else STATUS_EMOJIS["disabled"]
+    enabled = not client.enabled
+    client.enabled = enabled
+    status = "enabled" if enabled else "disabled"
+    emoji = STATUS_EMOJIS[status]
     print_rgb(f"{ICONS['canvas']} Canvas {emoji} {status}", "accent")
 
 
 @app.callback()
 def main(
     ctx: typer.Context,
-    host: str = typer.Option("localhost", help="SignalRGB API host"),
-    port: int = typer.Option(16038, help="SignalRGB API port"),
+    host: str = typer.Option(DEFAULT_HOST, help="SignalRGB API host"),
+    port: int = typer.Option(DEFAULT_PORT, help="SignalRGB API port"),
     full_rgb: bool = typer.Option(
         False, "--full-rgb", help="Enable full RGB gradient mode for all output"
     ),
@@ -723,7 +891,7 @@ def main(
     """Initialize SignalRGB client."""
     global FULL_RGB_MODE
     FULL_RGB_MODE = full_rgb
-    ctx.obj = SignalRGBClient(host, port)
+    ctx.obj = ClientFactory(host, port)
 
 
 if __name__ == "__main__":
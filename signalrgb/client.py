@@ -7,16 +7,43 @@
 
 from __future__ import annotations
 
+import dataclasses
+import functools
+import inspect
 import os
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import contextmanager
-from functools import lru_cache
-from typing import Any, Dict, Iterator, List, Optional
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+    cast,
+)
 
 import requests
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException, Timeout
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+try:
+    import orjson as _json
+except ImportError:
+    import json as _json  # type: ignore[no-redef]
 
 from .model import (
     CurrentLayoutResponse,
+    CurrentState,
     CurrentStateHolder,
     CurrentStateResponse,
     Effect,
@@ -31,10 +58,35 @@
     SignalRGBResponse,
 )
 
+DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 16038
 LIGHTING_V1 = "/api/v1/lighting"
 SCENES_V1 = "/api/v1/scenes"
 
+# Keep-alive connections held open to the SignalRGB host; large enough for
+# concurrent callers sharing one client
+DEFAULT_POOL_MAXSIZE = 16
+
+# urllib3's defaults (TCP_NODELAY) plus TCP keep-alive probes, so idle pooled
+# connections are kept warm instead of being silently dropped
+KEEPALIVE_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+# Transient failures are retried with exponential backoff. POST is left out of
+# RETRY_METHODS because next/previous/shuffle are not idempotent.
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_BACKOFF_FACTOR = 0.1
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+RETRY_METHODS = frozenset({"GET", "PATCH"})
+
+# Seconds the effect list is cached before it is fetched again
+DEFAULT_EFFECTS_TTL = 60.0
+
+# Seconds a lighting state snapshot is reused, so back-to-back reads of
+# brightness and enabled share one request
+DEFAULT_STATE_TTL = 0.1
+
 
 class SignalRGBException(Exception):
     """Base exception for SignalRGB errors.
@@ -87,6 +139,50 @@ class NotFoundError(SignalRGBException):
     """
 
 
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTP adapter whose pooled connections enable TCP keep-alive."""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", KEEPALIVE_SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _translate_errors(codes: Dict[str, Optional[str]]) -> Callable[[F], F]:
+    """Translate API error codes raised by a client method.
+
+    Args:
+        codes: Maps an API error code to a NotFoundError message, formatted with
+            the method's arguments, or to None to make the method return None.
+
+    Returns:
+        A decorator applying the translation to a client method.
+    """
+
+    def decorator(func: F) -> F:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return func(*args, **kwargs)
+            except APIError as e:
+                code = e.error.code if e.error else None
+                if code not in codes:
+                    raise
+                message = codes[code]
+                if message is None:
+                    return None
+                arguments = signature.bind(*args, **kwargs).arguments
+                raise NotFoundError(message.format(**arguments), e.error)
+
+        return cast(F, wrapper)
+
+    return decorator
+
+
 class SignalRGBClient:
     """Client for interacting with the SignalRGB API.
 
@@ -95,26 +191,115 @@ class SignalRGBClient:
     """
 
     def __init__(
-        self, host: str = "localhost", port: int = DEFAULT_PORT, timeout: float = 10.0
+        self,
+        host: str = DEFAULT_HOST,
+        port: int = DEFAULT_PORT,
+        timeout: float = 10.0,
+        session: Optional[requests.Session] = None,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = DEFAULT_BACKOFF_FACTOR,
+        effects_ttl: Optional[float] = DEFAULT_EFFECTS_TTL,
+        state_ttl: float = DEFAULT_STATE_TTL,
     ):
         """Initialize the SignalRGBClient.
 
         Args:
-            host: The host of the SignalRGB API. Defaults to 'localhost'.
+            host: The host of the SignalRGB API. Defaults to DEFAULT_HOST.
             port: The port of the SignalRGB API. Defaults to DEFAULT_PORT.
             timeout: The timeout for API requests in seconds. Defaults to 10.0.
+            session: An optional pre-configured requests Session to use. By default
+                a new session is created with a pooled keep-alive adapter. A
+                supplied session is left open by close().
+            max_retries: How many times to retry connection errors and transient
+                HTTP errors (429 and 5xx) on the default session. Read timeouts
+                are not retried, so a stalled response fails after one timeout.
+                Defaults to 3.
+            backoff_factor: Backoff factor for the exponential delay between
+                retries, in seconds. Defaults to 0.1.
+            effects_ttl: How long get_effects results are cached, in seconds.
+                None caches them until refresh_effects is called. Defaults to 60.0.
+            state_ttl: How long a lighting state snapshot is reused by the
+                brightness, enabled and current state getters, in seconds. Any
+                write clears it. 0 disables the cache. Defaults to 0.1.
 
         Example:
             >>> client = SignalRGBClient()
             >>> client = SignalRGBClient("192.168.1.100", 8080, 5.0)
         """
         self._base_url = f"http://{host}:{port}"
-        self._session = requests.Session()
+        self._lighting_url = f"{self._base_url}{LIGHTING_V1}"
+        self._scenes_url = f"{self._base_url}{SCENES_V1}"
+        # Only a session created here is closed by close()
+        self._owns_session = session is None
+        self._session = (
+            session
+            if session is not None
+            else self._create_session(max_retries, backoff_factor)
+        )
         self._timeout = timeout
+        self._debug = os.getenv("SIGNALRGB_DEBUG", "0") == "1"
+        self._effects_ttl = effects_ttl
+        # (expiry time on the monotonic clock, effects, effects by name and by ID)
+        self._effects_cache: Optional[
+            Tuple[float, List[Effect], Dict[str, Effect], Dict[str, Effect]]
+        ] = None
+        self._state_ttl = state_ttl
+        # (expiry time on the monotonic clock, state); the generation counts
+        # invalidations so a read that overlaps a write never caches stale state
+        self._state_cache: Optional[Tuple[float, CurrentStateHolder]] = None
+        self._state_generation = 0
+        self._state_lock = threading.Lock()
+
+    @staticmethod
+    def _create_session(max_retries: int, backoff_factor: float) -> requests.Session:
+        """Create a session that keeps connections to the API alive between calls.
+
+        Args:
+            max_retries: How many times to retry connection and status failures.
+            backoff_factor: Backoff factor for the delay between retries.
+
+        Returns:
+            requests.Session: A session with a pooled, retrying HTTP adapter mounted.
+        """
+        # read=0: a timed-out read is not retried, which would multiply the
+        # worst-case latency of a call by max_retries + 1
+        retry = Retry(
+            total=max_retries,
+            read=0,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUSES,
+            allowed_methods=RETRY_METHODS,
+            raise_on_status=False,
+        )
+        session = requests.Session()
+        session.mount(
+            "http://",
+            _KeepAliveAdapter(pool_maxsize=DEFAULT_POOL_MAXSIZE, max_retries=retry),
+        )
+        session.headers.update({"Accept": "application/json"})
+        return session
+
+    def close(self) -> None:
+        """Close the underlying session and release its pooled connections.
+
+        A session passed in by the caller is left open for the caller to close.
+
+        Example:
+            >>> client = SignalRGBClient()
+            >>> client.close()
+        """
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self) -> SignalRGBClient:
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     @contextmanager
     def _request_context(
-        self, method: str, endpoint: str, **kwargs: Any
+        self, method: str, url: str, **kwargs: Any
     ) -> Iterator[Dict[str, Any]]:
         """Context manager for making API requests.
 
@@ -122,7 +307,7 @@ def _request_context(
 
         Args:
             method: The HTTP method to use for the request.
-            endpoint: The API endpoint to request.
+            url: The absolute URL of the API endpoint to request.
             **kwargs: Additional arguments to pass to the request.
 
         Yields:
@@ -133,8 +318,11 @@ def _request_context(
             APIError: If there's an API error.
             SignalRGBException: For any other unexpected errors.
         """
-        url = f"{self._base_url}{endpoint}"
-        debug = os.getenv("SIGNALRGB_DEBUG", "0") == "1"
+        debug = self._debug
+        # Writes may change the lighting state
+        is_write = method != "GET"
+        if is_write:
+            self._invalidate_state()
 
         if debug:
             print(f"DEBUG: Request URL: {url}")
@@ -153,7 +341,13 @@ def _request_context(
                 print(f"DEBUG: Response Headers: {response.headers}")
                 print(f"DEBUG: Response Content: {response.text}")
 
-            yield response.json()
+            try:
+                data = _json.loads(response.content)
+            except ValueError as e:
+                raise APIError(
+                    f"Invalid JSON in the response: {e}", Error(title="Invalid JSON")
+                )
+            yield data
         except requests.ConnectionError as e:
             raise ConnectionError(
                 f"Failed to connect to SignalRGB API: {e}", Error(title=str(e))
@@ -161,24 +355,41 @@ def _request_context(
         except Timeout:
             raise ConnectionError("Request timed out", Error(title="Request Timeout"))
         except requests.HTTPError as e:
+            error = Error(title=str(e))
             if e.response is not None:
-                error_data = e.response.json().get("errors", [{}])[0]
-                error = Error.from_dict(error_data)
-                raise APIError(f"HTTP error occurred: {e}", error)
-            raise APIError(f"HTTP error occurred: {e}", Error(title=str(e)))
+                try:
+                    body = _json.loads(e.response.content)
+                    error = Error.from_dict(body["errors"][0])
+                except (ValueError, LookupError, TypeError):
+                    # Non-JSON or malformed error bodies keep the generic error
+                    pass
+            raise APIError(f"HTTP error occurred: {e}", error)
         except RequestException as e:
             raise APIError(
                 f"An error occurred while making the request: {e}", Error(title=str(e))
             )
-        except APIError as e:
-            raise e
+        except SignalRGBException:
+            # Raised by the caller's block, e.g. a non-OK status; pass it through
+            raise
         except Exception as e:
             raise SignalRGBException(f"An unexpected error occurred: {e}")
+        finally:
+            if is_write:
+                # Also drop snapshots taken while the write was in flight
+                self._invalidate_state()
+
+    def _invalidate_state(self) -> None:
+        """Drop the cached lighting state snapshot."""
+        with self._state_lock:
+            self._state_cache = None
+            self._state_generation += 1
 
-    @lru_cache(maxsize=1)
     def get_effects(self) -> List[Effect]:
         """List available effects.
 
+        The list is cached on the client for effects_ttl seconds, or until
+        refresh_effects is called.
+
         Returns:
             List[Effect]: A list of available effects.
 
@@ -192,14 +403,42 @@ def get_effects(self) -> List[Effect]:
             >>> effects = client.get_effects()
             >>> print(f"Found {len(effects)} effects")
         """
-        with self._request_context("GET", f"{LIGHTING_V1}/effects") as data:
+        return self._cached_effects()[1]
+
+    def _cached_effects(
+        self,
+    ) -> Tuple[float, List[Effect], Dict[str, Effect], Dict[str, Effect]]:
+        """Get the cached effect list entry, fetching it if missing or expired.
+
+        Returns:
+            The cache entry: its expiry time on the monotonic clock, the list of
+            effects, and the effects indexed by name and by ID.
+
+        Raises:
+            ConnectionError: If there's a connection error.
+            APIError: If there's an error retrieving the effects.
+            SignalRGBException: For any other unexpected errors.
+        """
+        cache = self._effects_cache
+        if cache is not None and time.monotonic() < cache[0]:
+            return cache
+
+        with self._request_context("GET", f"{self._lighting_url}/effects") as data:
             response = EffectListResponse.from_dict(data)
             self._ensure_response_ok(response)
             effects = response.data
             if effects is None or effects.items is None:
                 raise APIError("No effects data in the response")
-            return effects.items
 
+        ttl = self._effects_ttl
+        expires = float("inf") if ttl is None else time.monotonic() + ttl
+        # Reversed so the first effect wins when names are duplicated
+        by_name = {e.attributes.name: e for e in reversed(effects.items)}
+        by_id = {e.id: e for e in effects.items}
+        self._effects_cache = (expires, effects.items, by_name, by_id)
+        return self._effects_cache
+
+    @_translate_errors({"not_found": "Effect with ID '{effect_id}' not found"})
     def get_effect(self, effect_id: str) -> Effect:
         """Get details of a specific effect.
 
@@ -220,19 +459,14 @@ def get_effect(self, effect_id: str) -> Effect:
             >>> effect = client.get_effect("example_effect_id")
             >>> print(f"Effect name: {effect.attributes.name}")
         """
-        try:
-            with self._request_context(
-                "GET", f"{LIGHTING_V1}/effects/{effect_id}"
-            ) as data:
-                response = EffectDetailsResponse.from_dict(data)
-                self._ensure_response_ok(response)
-                if response.data is None:
-                    raise APIError("No effect data in the response")
-                return response.data
-        except APIError as e:
-            if e.error and e.error.code == "not_found":
-                raise NotFoundError(f"Effect with ID '{effect_id}' not found", e.error)
-            raise
+        with self._request_context(
+            "GET", f"{self._lighting_url}/effects/{effect_id}"
+        ) as data:
+            response = EffectDetailsResponse.from_dict(data)
+            self._ensure_response_ok(response)
+            if response.data is None:
+                raise APIError("No effect data in the response")
+            return response.data
 
     def get_effect_by_name(self, effect_name: str) -> Effect:
         """Get details of a specific effect by name.
@@ -254,13 +488,24 @@ def get_effect_by_name(self, effect_name: str) -> Effect:
             >>> effect = client.get_effect_by_name("Rainbow Wave")
             >>> print(f"Effect ID: {effect.id}")
         """
-        effect = next(
-            (e for e in self.get_effects() if e.attributes.name == effect_name),
-            None,
-        )
+        return self.get_effect(self._find_effect(effect_name).id)
+
+    def _find_effect(self, effect_name: str) -> Effect:
+        """Find an effect by name in the cached effect list.
+
+        Args:
+            effect_name: The name of the effect to find.
+
+        Returns:
+            Effect: The effect as listed by get_effects, without fetching details.
+
+        Raises:
+            NotFoundError: If the effect with the given name is not found.
+        """
+        effect = self._cached_effects()[2].get(effect_name)
         if effect is None:
             raise NotFoundError(f"Effect '{effect_name}' not found")
-        return self.get_effect(effect.id)
+        return effect
 
     @property
     def current_effect(self) -> Effect:
@@ -274,9 +519,14 @@ def current_effect(self) -> Effect:
         """
         return self.get_current_effect()
 
-    def get_current_effect(self) -> Effect:
+    def get_current_effect(self, details: bool = True) -> Effect:
         """Get the current effect.
 
+        Args:
+            details (bool): Whether to fetch the full effect details. When False and
+                the effect list is already cached, the effect is served from the
+                cache, saving a request. Defaults to True.
+
         Returns:
             Effect: The currently active effect.
 
@@ -293,25 +543,65 @@ def get_current_effect(self) -> Effect:
         state = self._get_current_state()
         if state.attributes is None:
             raise APIError("No current effect data in the response")
+        if not details:
+            cache = self._effects_cache
+            if cache is not None and time.monotonic() < cache[0]:
+                effect = cache[3].get(state.id)
+                if effect is not None:
+                    return effect
         return self.get_effect(state.id)
 
+    def get_current_state(self) -> CurrentState:
+        """Get the current canvas state in a single request.
+
+        Returns:
+            CurrentState: The current effect name, enabled state and brightness. This
+            is a copy, so changing it does not affect the client's cached state.
+
+        Raises:
+            ConnectionError: If there's a connection error.
+            APIError: If there's an API error.
+            SignalRGBException: For any other unexpected errors.
+
+        Example:
+            >>> client = SignalRGBClient()
+            >>> state = client.get_current_state()
+            >>> print(f"Enabled: {state.enabled}, brightness: {state.global_brightness}")
+        """
+        return dataclasses.replace(self._get_current_state().attributes)
+
     def _get_current_state(self) -> CurrentStateHolder:
         """Get the current state of the SignalRGB instance.
 
         Returns:
-            CurrentStateHolder: The current state of the SignalRGB instance.
+            CurrentStateHolder: The current state of the SignalRGB instance. It may be
+            the cached snapshot shared with other callers, so treat it as read-only.
 
         Raises:
             ConnectionError: If there's a connection error.
             APIError: If there's an API error.
             SignalRGBException: For any other unexpected errors.
         """
-        with self._request_context("GET", LIGHTING_V1) as data:
+        with self._state_lock:
+            cache = self._state_cache
+            generation = self._state_generation
+        if cache is not None and time.monotonic() < cache[0]:
+            return cache[1]
+
+        with self._request_context("GET", self._lighting_url) as data:
             response = CurrentStateResponse.from_dict(data)
-            self._ensure_response_ok(response)
+            # Inlined status check: this is the polling path for brightness/enabled
+            if response.status != "ok":
+                self._ensure_response_ok(response)
             if response.data is None:
                 raise APIError("No current state data in the response")
-            return response.data
+
+        if self._state_ttl > 0:
+            with self._state_lock:
+                if self._state_generation == generation:
+                    expires = time.monotonic() + self._state_ttl
+                    self._state_cache = (expires, response.data)
+        return response.data
 
     @property
     def brightness(self) -> int:
@@ -337,7 +627,7 @@ def brightness(self) -> int:
     def brightness(self, value: int) -> None:
         with self._request_context(
             "PATCH",
-            f"{LIGHTING_V1}/global_brightness",
+            f"{self._lighting_url}/global_brightness",
             json={"global_brightness": value},
         ):
             pass
@@ -365,7 +655,7 @@ def enabled(self) -> bool:
     @enabled.setter
     def enabled(self, value: bool) -> None:
         with self._request_context(
-            "PATCH", f"{LIGHTING_V1}/enabled", json={"enabled": value}
+            "PATCH", f"{self._lighting_url}/enabled", json={"enabled": value}
         ):
             pass
 
@@ -386,17 +676,21 @@ def apply_effect(self, effect_id: str) -> None:
             >>> print("Effect applied successfully")
         """
         with self._request_context(
-            "POST", f"{LIGHTING_V1}/effects/{effect_id}/apply"
+            "POST", f"{self._lighting_url}/effects/{effect_id}/apply"
         ) as data:
             response = SignalRGBResponse.from_dict(data)
             self._ensure_response_ok(response)
 
-    def apply_effect_by_name(self, effect_name: str) -> None:
+    def apply_effect_by_name(self, effect_name: str) -> Effect:
         """Apply an effect by name.
 
         Args:
             effect_name: The name of the effect to apply.
 
+        Returns:
+            Effect: The applied effect as listed by get_effects, so callers can
+                reuse its ID without another request.
+
         Raises:
             NotFoundError: If the effect with the given name is not found.
             ConnectionError: If there's a connection error.
@@ -408,10 +702,17 @@ def apply_effect_by_name(self, effect_name: str) -> None:
             >>> client.apply_effect_by_name("Rainbow Wave")
             >>> print("Effect applied successfully")
         """
-        effect = self.get_effect_by_name(effect_name)
-        with self._request_context("POST", effect.links.apply):
+        effect = self._find_effect(effect_name)
+        apply_url = (
+            f"{self._base_url}{effect.links.apply}"
+            if effect.links.apply
+            else f"{self._lighting_url}/effects/{effect.id}/apply"
+        )
+        with self._request_context("POST", apply_url):
             pass
+        return effect
 
+    @_translate_errors({"not_found": "Effect with ID '{effect_id}' not found"})
     def get_effect_presets(self, effect_id: str) -> List[EffectPreset]:
         """Get presets for a specific effect.
 
@@ -433,20 +734,58 @@ def get_effect_presets(self, effect_id: str) -> List[EffectPreset]:
             >>> for preset in presets:
             ...     print(f"Preset ID: {preset.id}, Name: {preset.name}")
         """
-        try:
-            with self._request_context(
-                "GET", f"{LIGHTING_V1}/effects/{effect_id}/presets"
-            ) as data:
-                response = EffectPresetListResponse.from_dict(data)
-                self._ensure_response_ok(response)
-                if response.data is None:
-                    raise APIError("No preset data in the response")
-                return response.data.items
-        except APIError as e:
-            if e.error and e.error.code == "not_found":
-                raise NotFoundError(f"Effect with ID '{effect_id}' not found", e.error)
-            raise
+        with self._request_context(
+            "GET", f"{self._lighting_url}/effects/{effect_id}/presets"
+        ) as data:
+            response = EffectPresetListResponse.from_dict(data)
+            self._ensure_response_ok(response)
+            if response.data is None:
+                raise APIError("No preset data in the response")
+            return response.data.items
+
+    def get_effect_presets_bulk(
+        self, effect_ids: Iterable[str], max_workers: int = 8
+    ) -> Dict[str, Union[List[EffectPreset], SignalRGBException]]:
+        """Get presets for several effects concurrently.
+
+        The requests are spread over a thread pool and share the session's pooled
+        keep-alive connections, so the batch takes roughly as long as the slowest
+        request. A failure for one effect does not abort the others; its exception
+        is returned in place of the presets.
+
+        Args:
+            effect_ids (Iterable[str]): The IDs of the effects to retrieve presets for.
+            max_workers (int): The maximum number of concurrent requests. Defaults to 8.
+
+        Returns:
+            Dict[str, Union[List[EffectPreset], SignalRGBException]]: The presets for
+            each effect ID, or the exception raised while fetching them.
 
+        Example:
+            >>> client = SignalRGBClient()
+            >>> results = client.get_effect_presets_bulk(["effect1", "effect2"])
+            >>> for effect_id, presets in results.items():
+            ...     if isinstance(presets, SignalRGBException):
+            ...         print(f"{effect_id}: {presets}")
+        """
+        ids = list(dict.fromkeys(effect_ids))
+        if not ids:
+            return {}
+
+        def fetch(
+            effect_id: str,
+        ) -> Union[List[EffectPreset], SignalRGBException]:
+            try:
+                return self.get_effect_presets(effect_id)
+            except SignalRGBException as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(ids))) as executor:
+            return dict(zip(ids, executor.map(fetch, ids)))
+
+    @_translate_errors(
+        {"not_found": "Effect with ID '{effect_id}' or preset '{preset_id}' not found"}
+    )
     def apply_effect_preset(self, effect_id: str, preset_id: str) -> None:
         """Apply a preset for a specific effect.
 
@@ -465,22 +804,15 @@ def apply_effect_preset(self, effect_id: str, preset_id: str) -> None:
             >>> client.apply_effect_preset("example_effect_id", "My Fancy Preset 1")
             >>> print("Preset applied successfully")
         """
-        try:
-            with self._request_context(
-                "PATCH",
-                f"{LIGHTING_V1}/effects/{effect_id}/presets",
-                json={"preset": preset_id},
-            ) as data:
-                response = EffectPresetResponse.from_dict(data)
-                self._ensure_response_ok(response)
-        except APIError as e:
-            if e.error and e.error.code == "not_found":
-                raise NotFoundError(
-                    f"Effect with ID '{effect_id}' or preset '{preset_id}' not found",
-                    e.error,
-                )
-            raise
+        with self._request_context(
+            "PATCH",
+            f"{self._lighting_url}/effects/{effect_id}/presets",
+            json={"preset": preset_id},
+        ) as data:
+            response = EffectPresetResponse.from_dict(data)
+            self._ensure_response_ok(response)
 
+    @_translate_errors({"409": None})
     def get_next_effect(self) -> Optional[Effect]:
         """Get information about the next effect in history.
 
@@ -500,15 +832,10 @@ def get_next_effect(self) -> Optional[Effect]:
             ... else:
             ...     print("No next effect available")
         """
-        try:
-            with self._request_context("GET", f"{LIGHTING_V1}/next") as data:
-                response = EffectDetailsResponse.from_dict(data)
-                self._ensure_response_ok(response)
-                return response.data
-        except APIError as e:
-            if e.error and e.error.code == "409":
-                return None
-            raise
+        with self._request_context("GET", f"{self._lighting_url}/next") as data:
+            response = EffectDetailsResponse.from_dict(data)
+            self._ensure_response_ok(response)
+            return response.data
 
     def apply_next_effect(self) -> Effect:
         """Apply the next effect in history or a random effect if there's no next effect.
@@ -526,13 +853,14 @@ def apply_next_effect(self) -> Effect:
             >>> new_effect = client.apply_next_effect()
             >>> print(f"Applied effect: {new_effect.attributes.name}")
         """
-        with self._request_context("POST", f"{LIGHTING_V1}/next") as data:
+        with self._request_context("POST", f"{self._lighting_url}/next") as data:
             response = EffectDetailsResponse.from_dict(data)
             self._ensure_response_ok(response)
             if response.data is None:
                 raise APIError("No effect data in the response")
             return response.data
 
+    @_translate_errors({"409": None})
     def get_previous_effect(self) -> Optional[Effect]:
         """Get information about the previous effect in history.
 
@@ -552,15 +880,10 @@ def get_previous_effect(self) -> Optional[Effect]:
             ... else:
             ...     print("No previous effect available")
         """
-        try:
-            with self._request_context("GET", f"{LIGHTING_V1}/previous") as data:
-                response = EffectDetailsResponse.from_dict(data)
-                self._ensure_response_ok(response)
-                return response.data
-        except APIError as e:
-            if e.error and e.error.code == "409":
-                return None
-            raise
+        with self._request_context("GET", f"{self._lighting_url}/previous") as data:
+            response = EffectDetailsResponse.from_dict(data)
+            self._ensure_response_ok(response)
+            return response.data
 
     def apply_previous_effect(self) -> Effect:
         """Apply the previous effect in history.
@@ -578,7 +901,7 @@ def apply_previous_effect(self) -> Effect:
             >>> new_effect = client.apply_previous_effect()
             >>> print(f"Applied effect: {new_effect.attributes.name}")
         """
-        with self._request_context("POST", f"{LIGHTING_V1}/previous") as data:
+        with self._request_context("POST", f"{self._lighting_url}/previous") as data:
             response = EffectDetailsResponse.from_dict(data)
             self._ensure_response_ok(response)
             if response.data is None:
@@ -601,7 +924,7 @@ def apply_random_effect(self) -> Effect:
             >>> random_effect = client.apply_random_effect()
             >>> print(f"Applied random effect: {random_effect.attributes.name}")
         """
-        with self._request_context("POST", f"{LIGHTING_V1}/shuffle") as data:
+        with self._request_context("POST", f"{self._lighting_url}/shuffle") as data:
             response = EffectDetailsResponse.from_dict(data)
             self._ensure_response_ok(response)
             if response.data is None:
@@ -625,7 +948,7 @@ def current_layout(self) -> Layout:
             >>> current_layout = client.current_layout
             >>> print(f"Current layout: {current_layout.id}")
         """
-        with self._request_context("GET", f"{SCENES_V1}/current_layout") as data:
+        with self._request_context("GET", f"{self._scenes_url}/current_layout") as data:
             response = CurrentLayoutResponse.from_dict(data)
             self._ensure_response_ok(response)
             if response.data is None or response.data.current_layout is None:
@@ -650,7 +973,7 @@ def current_layout(self, layout_id: str) -> None:
             >>> print(f"New current layout: {client.current_layout.id}")
         """
         with self._request_context(
-            "PATCH", f"{SCENES_V1}/current_layout", json={"layout": layout_id}
+            "PATCH", f"{self._scenes_url}/current_layout", json={"layout": layout_id}
         ) as data:
             response = CurrentLayoutResponse.from_dict(data)
             self._ensure_response_ok(response)
@@ -676,12 +999,12 @@ def get_layouts(self) -> List[Layout]:
             >>> for layout in layouts:
             ...     print(f"Layout: {layout.id}")
         """
-        with self._request_context("GET", f"{SCENES_V1}/layouts") as data:
+        with self._request_context("GET", f"{self._scenes_url}/layouts") as data:
             response = LayoutListResponse.from_dict(data)
             self._ensure_response_ok(response)
-            if "data" not in data or "items" not in data["data"]:
+            if response.data is None:
                 raise APIError("No layouts data in the response")
-            return [Layout.from_dict(item) for item in data["data"]["items"]]
+            return response.data.items
 
     @staticmethod
     def _ensure_response_ok(response: SignalRGBResponse) -> None:
@@ -700,15 +1023,15 @@ def _ensure_response_ok(response: SignalRGBResponse) -> None:
     def refresh_effects(self) -> None:
         """Refresh the cached effects.
 
-        This method clears the cache for the get_effects method, forcing a fresh
-        retrieval of effects on the next call.
+        This method clears the cached effect list, forcing a fresh retrieval of
+        effects on the next call to get_effects.
 
         Example:
             >>> client = SignalRGBClient()
             >>> client.refresh_effects()
             >>> fresh_effects = client.get_effects()
         """
-        self.get_effects.cache_clear()
+        self._effects_cache = None
 
     def __repr__(self) -> str:
         return f"SignalRGBClient(base_url='{self._base_url}')"
@@ -8,6 +8,7 @@
 
 from typing import Any, Dict, List, Optional
 from dataclasses import dataclass, field
+from functools import cached_property
 from mashumaro import DataClassDictMixin
 from mashumaro.config import BaseConfig
 
@@ -45,6 +46,16 @@ class Attributes(DataClassDictMixin):
     uses_meters: bool = False
     uses_video: bool = False
 
+    @cached_property
+    def name_folded(self) -> str:
+        """str: The case-folded effect name, computed once for searching."""
+        return self.name.casefold()
+
+    @cached_property
+    def description_folded(self) -> str:
+        """str: The case-folded description, or an empty string if there is none."""
+        return self.description.casefold() if self.description else ""
+
 
 @dataclass
 class Links(DataClassDictMixin):
@@ -310,10 +321,10 @@ class LayoutListResponse(SignalRGBResponse):
     the list of layouts.
 
     Attributes:
-        data (Optional[Dict[str, Any]]): The data containing the list of layouts returned by the API, if available.
+        data (Optional[LayoutList]): The list of layouts returned by the API, if available.
     """
 
-    data: Optional[Dict[str, Any]] = None
+    data: Optional[LayoutList] = None
 
 
 @dataclass
@@ -0,0 +1,103 @@
+import asyncio
+import json
+import unittest
+from unittest.mock import Mock, patch
+
+from signalrgb.async_client import AsyncSignalRGBClient
+from signalrgb.client import NotFoundError, SignalRGBClient
+from signalrgb.model import (
+    EffectPreset,
+    EffectPresetList,
+    EffectPresetListResponse,
+    Error,
+    SignalRGBResponse,
+)
+
+
+class TestAsyncSignalRGBClient(unittest.IsolatedAsyncioTestCase):
+    """Tests for the AsyncSignalRGBClient class."""
+
+    def setUp(self):
+        """Set up the client for each test."""
+        self.client = AsyncSignalRGBClient("testhost", 12345)
+
+    @patch("requests.Session.request")
+    async def test_concurrent_get_effect_presets(self, mock_request):
+        """Test fetching presets for several effects concurrently."""
+        mock_response = Mock()
+        response = EffectPresetListResponse(
+            api_version="1.0",
+            id=1,
+            method="GET",
+            status="ok",
+            data=EffectPresetList(
+                id="effect1",
+                items=[EffectPreset(id="preset1", type="preset")],
+            ),
+        )
+        mock_response.content = json.dumps(response.to_dict()).encode()
+        mock_request.return_value = mock_response
+
+        results = await asyncio.gather(
+            self.client.get_effect_presets("effect1"),
+            self.client.get_effect_presets("effect2"),
+        )
+        self.assertEqual([r[0].id for r in results], ["preset1", "preset1"])
+        urls = sorted(call.args[1] for call in mock_request.call_args_list)
+        self.assertEqual(
+            urls,
+            [
+                "http://testhost:12345/api/v1/lighting/effects/effect1/presets",
+                "http://testhost:12345/api/v1/lighting/effects/effect2/presets",
+            ],
+        )
+
+    @patch("requests.Session.request")
+    async def test_set_brightness(self, mock_request):
+        """Test setting the brightness level."""
+        mock_response = Mock()
+        mock_response.content = json.dumps(
+            SignalRGBResponse(
+                api_version="1.0", id=1, method="PATCH", status="ok"
+            ).to_dict()
+        ).encode()
+        mock_request.return_value = mock_response
+
+        await self.client.set_brightness(40)
+        mock_request.assert_called_once_with(
+            "PATCH",
+            "http://testhost:12345/api/v1/lighting/global_brightness",
+            timeout=10.0,
+            json={"global_brightness": 40},
+        )
+
+    async def test_errors_propagate(self):
+        """Test that client exceptions are raised from the awaited call."""
+        client = Mock(spec=SignalRGBClient)
+        client.get_effect.side_effect = NotFoundError(
+            "Effect with ID 'missing' not found",
+            Error(title="Not Found", code="not_found"),
+        )
+        async_client = AsyncSignalRGBClient(client=client)
+
+        with self.assertRaises(NotFoundError):
+            await async_client.get_effect("missing")
+
+    @patch("signalrgb.async_client.SignalRGBClient")
+    async def test_context_manager_closes_client(self, mock_client_class):
+        """Test that leaving the context manager closes the client it created."""
+        client = mock_client_class.return_value
+        async with AsyncSignalRGBClient("testhost", 12345):
+            client.close.assert_not_called()
+        client.close.assert_called_once()
+
+    async def test_close_leaves_wrapped_client_open(self):
+        """Test that a caller-supplied client is not closed."""
+        client = Mock(spec=SignalRGBClient)
+        async with AsyncSignalRGBClient(client=client):
+            pass
+        client.close.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,11 +1,33 @@
 from unittest.mock import patch
 
 import pytest
+from rich.console import Console
+from rich.panel import Panel
+from rich.text import Span, Text
 from typer.testing import CliRunner
 
-from signalrgb.cli import app
-from signalrgb.client import SignalRGBException
-from signalrgb.model import Attributes, Effect, EffectPreset, Layout, Links
+from signalrgb.cli import (
+    GRADIENT_COLORS,
+    GRADIENT_RING,
+    GRADIENT_RING_SIZE,
+    TITLE_STYLE,
+    _gradient,
+    app,
+    apply_gradient_to_text,
+    color_gradient,
+    create_colorful_table,
+    create_section,
+    format_parameter_value,
+)
+from signalrgb.client import NotFoundError, SignalRGBException
+from signalrgb.model import (
+    Attributes,
+    CurrentState,
+    Effect,
+    EffectPreset,
+    Layout,
+    Links,
+)
 
 
 @pytest.fixture
@@ -19,6 +41,23 @@ def runner():
     return CliRunner()
 
 
+@pytest.fixture
+def terminal():
+    """Render as if attached to a terminal, without ANSI styling."""
+    with patch(
+        "signalrgb.cli.console",
+        Console(force_terminal=True, color_system=None, width=120),
+    ):
+        yield
+
+
+@pytest.fixture
+def full_rgb():
+    """Render helpers in full RGB gradient mode."""
+    with patch("signalrgb.cli.FULL_RGB_MODE", True):
+        yield
+
+
 def test_list_effects(runner, mock_client):
     mock_effects = [
         Effect(
@@ -68,10 +107,10 @@ def test_get_effect(runner, mock_client):
     assert "Test Effect" in result.output
     assert "Test Publisher" in result.output
     assert "Test Description" in result.output
-    assert "Uses Audio " in result.output
-    assert "Uses Video " in result.output
-    assert "Uses Input " in result.output
-    assert "Uses Meters " in result.output
+    assert "Uses Audio\t" in result.output
+    assert "Uses Video\t" in result.output
+    assert "Uses Input\t" in result.output
+    assert "Uses Meters\t" in result.output
 
 
 def test_current_effect(runner, mock_client):
@@ -99,10 +138,56 @@ def test_current_effect(runner, mock_client):
     assert "effect1" in result.output
     assert "Test Publisher" in result.output
     assert "Test Description" in result.output
+    assert "Uses Audio\t" in result.output
+    assert "Uses Video\t" in result.output
+    assert "Uses Input\t" in result.output
+    assert "Uses Meters\t" in result.output
+
+
+def test_effect_panel_in_terminal(runner, mock_client, terminal):
+    mock_client.return_value.get_current_effect.return_value = Effect(
+        id="effect1",
+        type="lighting",
+        attributes=Attributes(
+            name="Current Effect",
+            publisher="Test Publisher",
+            description="Test Description",
+            uses_audio=True,
+            parameters={"speed": {"label": "Speed", "value": 5}},
+        ),
+        links=Links(),
+    )
+
+    result = runner.invoke(app, ["effect"])
+    assert result.exit_code == 0
+    assert "╭" in result.output
+    assert "Current Effect" in result.output
     assert "Uses Audio " in result.output
-    assert "Uses Video " in result.output
-    assert "Uses Input " in result.output
-    assert "Uses Meters " in result.output
+    assert "Parameters" in result.output
+    assert "\t" not in result.output
+
+
+def test_effect_records_when_piped(runner, mock_client):
+    mock_client.return_value.get_current_effect.return_value = Effect(
+        id="effect1",
+        type="lighting",
+        attributes=Attributes(
+            name="Test Effect",
+            parameters={
+                "speed": {"label": "Speed", "value": 5},
+                "tint": {"label": "Tint", "value": "#ff0000", "type": "color"},
+            },
+        ),
+        links=Links(),
+    )
+
+    result = runner.invoke(app, ["effect"])
+    assert result.exit_code == 0
+    assert "╭" not in result.output
+    assert "ID\teffect1\n" in result.output
+    assert "Description\tN/A\n" in result.output
+    assert "Speed\t5\n" in result.output
+    assert "Tint\t#ff0000\n" in result.output
 
 
 def test_apply_effect(runner, mock_client):
@@ -111,6 +196,57 @@ def test_apply_effect(runner, mock_client):
     assert "Applied effect: Test Effect" in result.output
 
 
+def test_apply_effect_with_preset(runner, mock_client):
+    mock_client.return_value.apply_effect_by_name.return_value = Effect(
+        id="effect1",
+        type="lighting",
+        attributes=Attributes(name="Test Effect"),
+        links=Links(),
+    )
+
+    result = runner.invoke(
+        app, ["effect", "apply", "Test Effect", "--preset", "preset1"]
+    )
+    assert result.exit_code == 0
+    assert "Applied effect: Test Effect with preset: preset1" in result.output
+    mock_client.return_value.apply_effect_preset.assert_called_once_with(
+        "effect1", "preset1"
+    )
+    mock_client.return_value.get_effect_by_name.assert_not_called()
+
+
+def test_list_effects_in_terminal(runner, mock_client, terminal):
+    mock_client.return_value.get_effects.return_value = [
+        Effect(
+            id="effect1",
+            type="lighting",
+            attributes=Attributes(name="Effect 1"),
+            links=Links(),
+        ),
+    ]
+
+    result = runner.invoke(app, ["effect", "list"])
+    assert result.exit_code == 0
+    assert "Available Effects" in result.output
+    assert "╭" in result.output
+    assert "Effect 1" in result.output
+
+
+def test_list_effects_when_piped(runner, mock_client):
+    mock_client.return_value.get_effects.return_value = [
+        Effect(
+            id="effect1",
+            type="lighting",
+            attributes=Attributes(name="Effect 1"),
+            links=Links(),
+        ),
+    ]
+
+    result = runner.invoke(app, ["effect", "list"])
+    assert result.exit_code == 0
+    assert result.output == "Effect 1\teffect1\n"
+
+
 def test_search_effects(runner, mock_client):
     mock_effects = [
         Effect(
@@ -143,6 +279,41 @@ def test_search_effects(runner, mock_client):
     assert "Description 2" in result.output
 
 
+def test_search_effects_piped_keeps_full_description(runner, mock_client):
+    description = "A long description that runs well past fifty characters in total"
+    mock_client.return_value.get_effects.return_value = [
+        Effect(
+            id="effect1",
+            type="lighting",
+            attributes=Attributes(name="Test Effect", description=description),
+            links=Links(),
+        )
+    ]
+
+    result = runner.invoke(app, ["effect", "search", "Test"])
+    assert result.exit_code == 0
+    assert result.output == f"Test Effect\t{description}\n"
+
+
+def test_search_effects_piped_escapes_separators(runner, mock_client):
+    mock_client.return_value.get_effects.return_value = [
+        Effect(
+            id="effect1",
+            type="lighting",
+            attributes=Attributes(
+                name="Test Effect", description="One\tTwo\nThree\r\nC:\\Four"
+            ),
+            links=Links(),
+        )
+    ]
+
+    result = runner.invoke(app, ["effect", "search", "Test"])
+    assert result.exit_code == 0
+    assert result.output == "Test Effect\tOne\\tTwo\\nThree\\r\\nC:\\\\Four\n"
+    assert result.output.count("\n") == 1
+    assert result.output.count("\t") == 1
+
+
 def test_brightness(runner, mock_client):
     mock_client.return_value.brightness = 50
 
@@ -179,12 +350,28 @@ def test_error_handling(runner, mock_client):
     assert "Error: Test error" in result.output
 
 
+def test_error_handling_not_found(runner, mock_client):
+    mock_client.return_value.get_effect_by_name.side_effect = NotFoundError(
+        "Effect 'Missing' not found"
+    )
+
+    result = runner.invoke(app, ["effect", "--name", "Missing"])
+    assert result.exit_code == 1
+    assert "Not Found: Effect 'Missing' not found" in result.output
+
+
 def test_main_callback(runner, mock_client):
     result = runner.invoke(app, ["--help"])
     assert result.exit_code == 0
     assert "SignalRGB CLI" in result.output
 
 
+def test_help_does_not_create_client(runner, mock_client):
+    result = runner.invoke(app, ["effect", "--help"])
+    assert result.exit_code == 0
+    mock_client.assert_not_called()
+
+
 def test_next_effect(runner, mock_client):
     mock_effect = Effect(
         id="next_effect",
@@ -227,6 +414,43 @@ def test_random_effect(runner, mock_client):
     assert "Applied random effect: Random Effect" in result.output
 
 
+def test_cycle_when_piped(runner, mock_client):
+    mock_client.return_value.get_effects.return_value = [
+        Effect(
+            id=f"effect{i}",
+            type="lighting",
+            attributes=Attributes(name=f"Effect {i}"),
+            links=Links(),
+        )
+        for i in range(2)
+    ]
+
+    with patch("signalrgb.cli.time.sleep") as mock_sleep:
+        result = runner.invoke(app, ["effect", "cycle", "--duration", "0"])
+    assert result.exit_code == 0
+    assert "Applied: Effect 0" in result.output
+    assert "Applied: Effect 1" in result.output
+    assert "Finished cycling through all effects" in result.output
+    assert mock_client.return_value.apply_effect.call_count == 2
+    assert mock_sleep.call_count == 2
+
+
+def test_cycle_in_terminal(runner, mock_client, terminal):
+    mock_client.return_value.get_effects.return_value = [
+        Effect(
+            id="effect1",
+            type="lighting",
+            attributes=Attributes(name="Effect 1"),
+            links=Links(),
+        )
+    ]
+
+    result = runner.invoke(app, ["effect", "cycle", "--duration", "0"])
+    assert result.exit_code == 0
+    assert "Finished cycling through all effects" in result.output
+    mock_client.return_value.apply_effect.assert_called_once_with("effect1")
+
+
 def test_refresh_effects(runner, mock_client):
     result = runner.invoke(app, ["effect", "refresh"])
     assert result.exit_code == 0
@@ -252,6 +476,40 @@ def test_list_presets(runner, mock_client):
     assert "preset2" in result.output
 
 
+def test_list_presets_terminal_keeps_brackets(runner, mock_client, terminal):
+    mock_client.return_value.get_current_effect.return_value = Effect(
+        id="current_effect",
+        type="lighting",
+        attributes=Attributes(name="[Beta] Effect"),
+        links=Links(),
+    )
+    mock_client.return_value.get_effect_presets.return_value = [
+        EffectPreset(id="[old] preset", type="preset"),
+    ]
+
+    result = runner.invoke(app, ["preset", "list"])
+    assert result.exit_code == 0
+    assert "[Beta] Effect" in result.output
+    assert "[old] preset" in result.output
+
+
+def test_preset_by_name(runner, mock_client):
+    mock_client.return_value.get_current_effect.return_value = Effect(
+        id="current_effect",
+        type="lighting",
+        attributes=Attributes(name="Current Effect"),
+        links=Links(),
+    )
+    mock_client.return_value.get_effect_presets.return_value = [
+        EffectPreset(id="preset1", type="preset"),
+        EffectPreset(id="preset2", type="preset"),
+    ]
+
+    result = runner.invoke(app, ["preset", "--name", "preset2"])
+    assert result.exit_code == 0
+    assert "Preset: preset2" in result.output
+
+
 def test_apply_preset(runner, mock_client):
     mock_client.return_value.get_current_effect.return_value = Effect(
         id="current_effect",
@@ -279,6 +537,21 @@ def test_list_layouts(runner, mock_client):
     assert "layout" in result.output
 
 
+def test_layout_by_name(runner, mock_client):
+    mock_client.return_value.get_layouts.return_value = [
+        Layout(id="layout1", type="layout"),
+        Layout(id="layout2", type="layout"),
+    ]
+
+    result = runner.invoke(app, ["layout", "--name", "layout2"])
+    assert result.exit_code == 0
+    assert "Layout: layout2" in result.output
+
+    result = runner.invoke(app, ["layout", "--name", "missing"])
+    assert result.exit_code == 1
+    assert "Layout 'missing' not found" in result.output
+
+
 def test_set_layout(runner, mock_client):
     result = runner.invoke(app, ["layout", "set", "layout1"])
     assert result.exit_code == 0
@@ -286,8 +559,9 @@ def test_set_layout(runner, mock_client):
 
 
 def test_canvas_info(runner, mock_client):
-    mock_client.return_value.enabled = True
-    mock_client.return_value.brightness = 75
+    mock_client.return_value.get_current_state.return_value = CurrentState(
+        name="Rainbow Wave", enabled=True, global_brightness=75
+    )
 
     result = runner.invoke(app, ["canvas"])
     assert result.exit_code == 0
@@ -297,6 +571,19 @@ def test_canvas_info(runner, mock_client):
     assert "75%" in result.output
 
 
+def test_canvas_info_in_terminal(runner, mock_client, terminal):
+    mock_client.return_value.get_current_state.return_value = CurrentState(
+        name="Rainbow Wave", enabled=False, global_brightness=40
+    )
+
+    result = runner.invoke(app, ["canvas"])
+    assert result.exit_code == 0
+    assert "Canvas Information" in result.output
+    assert "╭" in result.output
+    assert "Disabled" in result.output
+    assert "40%" in result.output
+
+
 def test_toggle_canvas(runner, mock_client):
     mock_client.return_value.enabled = False
 
@@ -309,3 +596,122 @@ def test_toggle_canvas(runner, mock_client):
     result = runner.invoke(app, ["canvas", "toggle"])
     assert result.exit_code == 0
     assert " disabled" in result.output
+
+
+def test_flexible_table_fits_render_width():
+    # The width is clamped to the space available where the table is rendered,
+    # not to the module console's size at construction
+    section = create_section([("Name", "A fairly long effect name")], width=100)
+    console = Console(width=120, color_system=None)
+
+    with console.capture() as capture:
+        console.print(Panel(section, width=40))
+    assert max(len(line) for line in capture.get().splitlines()) <= 40
+
+    with console.capture() as capture:
+        console.print(section)
+    assert max(len(line) for line in capture.get().splitlines()) == 100
+
+
+def test_gradient_interpolates_between_colors():
+    gradient = _gradient(("#000000", "#ff0000", "#0000ff"), 4)
+    assert gradient == ("#000000", "#7f0000", "#ff0000", "#7f007f")
+    # Whole segments only, so the ring can come up a few steps short
+    assert GRADIENT_RING_SIZE - len(GRADIENT_COLORS) < len(GRADIENT_RING)
+    assert len(GRADIENT_RING) <= GRADIENT_RING_SIZE
+    assert GRADIENT_RING[0] == GRADIENT_COLORS[0]
+
+
+def test_apply_gradient_spans():
+    text = apply_gradient_to_text("abc", GRADIENT_COLORS)
+    assert text.plain == "abc"
+    assert text.spans == [
+        Span(0, 1, GRADIENT_RING[0]),
+        Span(1, 2, GRADIENT_RING[1]),
+        Span(2, 3, GRADIENT_RING[2]),
+    ]
+
+    colors = ("#000000", "#ffffff")
+    gradient = _gradient(colors, GRADIENT_RING_SIZE)
+    text = apply_gradient_to_text("ab", colors)
+    assert text.spans == [Span(0, 1, gradient[0]), Span(1, 2, gradient[1])]
+
+
+def test_apply_gradient_rotates_by_line_offset():
+    text = apply_gradient_to_text("ab", GRADIENT_COLORS, line_offset=5)
+    assert text.spans == [Span(0, 1, GRADIENT_RING[5]), Span(1, 2, GRADIENT_RING[6])]
+
+    # Offsets wrap around the ring, and so do texts longer than it
+    ring_size = len(GRADIENT_RING)
+    wrapped = apply_gradient_to_text("ab", GRADIENT_COLORS, line_offset=ring_size + 5)
+    assert wrapped.spans == text.spans
+    text = apply_gradient_to_text("x" * (ring_size + 2), GRADIENT_COLORS, line_offset=1)
+    assert [span.style for span in text.spans[-3:]] == [
+        GRADIENT_RING[0],
+        GRADIENT_RING[1],
+        GRADIENT_RING[2],
+    ]
+
+
+def test_apply_gradient_empty_text():
+    text = apply_gradient_to_text("", GRADIENT_COLORS, line_offset=3)
+    assert text.plain == ""
+    assert text.spans == []
+
+
+def test_apply_gradient_spans_not_shared():
+    first = apply_gradient_to_text("abc", GRADIENT_COLORS)
+    first.stylize("bold", 0, 1)
+    second = apply_gradient_to_text("xyz", GRADIENT_COLORS)
+    assert len(second.spans) == 3
+
+
+def test_color_gradient_modes(full_rgb):
+    text = color_gradient("Title", GRADIENT_COLORS, line_number=2)
+    assert text.spans == apply_gradient_to_text("Title", GRADIENT_COLORS, 2).spans
+
+    with patch("signalrgb.cli.FULL_RGB_MODE", False):
+        text = color_gradient("Title", GRADIENT_COLORS)
+    assert text.plain == "Title"
+    assert text.style == TITLE_STYLE
+    assert text.spans == []
+
+
+def test_colorful_table_full_rgb_rows(full_rgb):
+    table = create_colorful_table("Effects", ["Name"], [("ab",), ("[x]",)])
+    first, second = table.columns[0]._cells
+    assert first.spans == [Span(0, 1, GRADIENT_RING[0]), Span(1, 2, GRADIENT_RING[1])]
+    # Each row starts one step further around the ring, and markup is literal
+    assert second.plain == "[x]"
+    assert second.spans[0] == Span(0, 1, GRADIENT_RING[1])
+
+
+def test_format_parameter_value_color():
+    value = format_parameter_value("#ff0000", "color")
+    assert isinstance(value, Text)
+    assert value.plain == "■■■■"
+    assert value.style == "#ff0000"
+    assert format_parameter_value("#ff0000") == "#ff0000"
+
+
+def test_effect_full_rgb_in_terminal(runner, mock_client, terminal):
+    mock_client.return_value.get_current_effect.return_value = Effect(
+        id="effect1",
+        type="lighting",
+        attributes=Attributes(
+            name="Test Effect",
+            description="A [bold]description",
+            parameters={
+                "tint": {"label": "Tint", "value": "#ff0000", "type": "color"},
+            },
+        ),
+        links=Links(),
+    )
+
+    # The flag sets a module global, so restore it once the command has run
+    with patch("signalrgb.cli.FULL_RGB_MODE", False):
+        result = runner.invoke(app, ["--full-rgb", "effect"])
+    assert result.exit_code == 0
+    assert "Test Effect" in result.output
+    assert "A [bold]description" in result.output
+    assert "■■■■" in result.output
@@ -1,3 +1,5 @@
+import json
+import socket
 import unittest
 from unittest.mock import Mock, patch
 
@@ -6,6 +8,8 @@
 import requests
 
 from signalrgb.client import (
+    DEFAULT_MAX_RETRIES,
+    DEFAULT_POOL_MAXSIZE,
     APIError,
     ConnectionError,
     SignalRGBClient,
@@ -23,6 +27,7 @@
     LayoutListResponse,
     Links,
     CurrentStateHolder,
+    CurrentStateResponse,
     CurrentState,
     SignalRGBResponse,
     EffectDetailsResponse,
@@ -30,8 +35,16 @@
     EffectList,
     Error,
     Layout,
+    LayoutList,
 )
 
+EFFECTS_URL = "http://testhost:12345/api/v1/lighting/effects"
+
+
+def json_body(data):
+    """Encode data as the raw JSON body of a mocked response."""
+    return json.dumps(data).encode()
+
 
 class BaseSignalRGBClientTest(unittest.TestCase):
     """Base class for SignalRGBClient tests."""
@@ -77,7 +90,7 @@ def test_get_effects(self, mock_request):
             status="ok",
             data=EffectList(items=effects),
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         effects = self.client.get_effects()
@@ -102,7 +115,7 @@ def test_get_effect(self, mock_request):
             status="ok",
             data=effect,
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         effect = self.client.get_effect("effect1")
@@ -128,7 +141,7 @@ def test_get_effect_by_name(self, mock_request):
             status="ok",
             data=EffectList(items=effects),
         )
-        mock_response_get_effects.json.return_value = response_get_effects.to_dict()
+        mock_response_get_effects.content = json_body(response_get_effects.to_dict())
 
         mock_response_get_effect = Mock()
         effect = Effect(
@@ -144,7 +157,7 @@ def test_get_effect_by_name(self, mock_request):
             status="ok",
             data=effect,
         )
-        mock_response_get_effect.json.return_value = response_get_effect.to_dict()
+        mock_response_get_effect.content = json_body(response_get_effect.to_dict())
 
         mock_request.side_effect = [
             mock_response_get_effects,
@@ -174,7 +187,9 @@ def test_get_current_effect(self, mock_request):
             status="ok",
             data=current_state,
         )
-        mock_response_current_state.json.return_value = response_current_state.to_dict()
+        mock_response_current_state.content = json_body(
+            response_current_state.to_dict()
+        )
 
         mock_response_get_effect = Mock()
         effect = Effect(
@@ -190,7 +205,7 @@ def test_get_current_effect(self, mock_request):
             status="ok",
             data=effect,
         )
-        mock_response_get_effect.json.return_value = response_get_effect.to_dict()
+        mock_response_get_effect.content = json_body(response_get_effect.to_dict())
 
         mock_request.side_effect = [
             mock_response_current_state,
@@ -201,6 +216,44 @@ def test_get_current_effect(self, mock_request):
         self.assertEqual(effect.id, "current_state")
         self.assertEqual(effect.attributes.name, "Current Effect")
 
+    @patch("requests.Session.request")
+    def test_get_current_effect_from_cache(self, mock_request):
+        """Test that the current effect is served from a warm effects cache."""
+        effect = Effect(
+            id="current_state",
+            type="lighting",
+            attributes=Attributes(name="Current Effect"),
+            links=Links(),
+        )
+        effects_response = EffectListResponse(
+            api_version="1.0",
+            id=1,
+            method="GET",
+            status="ok",
+            data=EffectList(items=[effect]),
+        )
+        state_response = EffectDetailsResponse(
+            api_version="1.0",
+            id=2,
+            method="GET",
+            status="ok",
+            data=CurrentStateHolder(
+                attributes=CurrentState(name="Current Effect"),
+                id="current_state",
+                links=Links(),
+                type="current_state",
+            ),
+        )
+        mock_request.side_effect = [
+            Mock(content=json_body(effects_response.to_dict())),
+            Mock(content=json_body(state_response.to_dict())),
+        ]
+
+        self.client.get_effects()
+        current = self.client.get_current_effect(details=False)
+        self.assertEqual(current.id, "current_state")
+        self.assertEqual(mock_request.call_count, 2)
+
     @patch("requests.Session.request")
     def test_apply_effect(self, mock_request):
         """Test applying an effect by ID."""
@@ -211,7 +264,7 @@ def test_apply_effect(self, mock_request):
             method="POST",
             status="ok",
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         self.client.apply_effect("effect1")
@@ -240,42 +293,26 @@ def test_apply_effect_by_name(self, mock_request):
             status="ok",
             data=EffectList(items=effects),
         )
-        mock_response_get_effects.json.return_value = response_get_effects.to_dict()
-
-        mock_response_get_effect = Mock()
-        effect = Effect(
-            id="effect1",
-            type="lighting",
-            attributes=Attributes(name="Test Effect 1"),
-            links=Links(apply="/api/v1/effects/effect1/apply"),
-        )
-        response_get_effect = EffectDetailsResponse(
-            api_version="1.0",
-            id=2,
-            method="GET",
-            status="ok",
-            data=effect,
-        )
-        mock_response_get_effect.json.return_value = response_get_effect.to_dict()
+        mock_response_get_effects.content = json_body(response_get_effects.to_dict())
 
         mock_response_apply = Mock()
         response_apply = SignalRGBResponse(
             api_version="1.0",
-            id=3,
+            id=2,
             method="POST",
             status="ok",
         )
-        mock_response_apply.json.return_value = response_apply.to_dict()
+        mock_response_apply.content = json_body(response_apply.to_dict())
 
         mock_request.side_effect = [
             mock_response_get_effects,
-            mock_response_get_effect,
             mock_response_apply,
         ]
 
-        self.client.apply_effect_by_name("Test Effect 1")
+        applied = self.client.apply_effect_by_name("Test Effect 1")
 
-        self.assertEqual(mock_request.call_count, 3)
+        self.assertEqual(applied.id, "effect1")
+        self.assertEqual(mock_request.call_count, 2)
 
         self.assert_request_called_with(
             mock_request, "POST", "http://testhost:12345/api/v1/effects/effect1/apply"
@@ -321,7 +358,7 @@ def test_brightness(self, mock_request):
             method="PATCH",
             status="ok",
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         self.client.brightness = 50
@@ -332,21 +369,129 @@ def test_brightness(self, mock_request):
             json={"global_brightness": 50},
         )
 
-        mock_response.json.return_value = {
-            "api_version": "1.0",
-            "id": 1,
-            "method": "GET",
-            "status": "ok",
-            "data": {
-                "attributes": {"global_brightness": 50, "enabled": False, "name": None},
-                "id": "current_state",
-                "links": {},
-                "type": "current_state",
-            },
-        }
+        mock_response.content = json_body(
+            {
+                "api_version": "1.0",
+                "id": 1,
+                "method": "GET",
+                "status": "ok",
+                "data": {
+                    "attributes": {
+                        "global_brightness": 50,
+                        "enabled": False,
+                        "name": None,
+                    },
+                    "id": "current_state",
+                    "links": {},
+                    "type": "current_state",
+                },
+            }
+        )
         brightness = self.client.brightness
         self.assertEqual(brightness, 50)
 
+    @patch("signalrgb.client.time.monotonic")
+    @patch("requests.Session.request")
+    def test_state_snapshot_cache(self, mock_request, mock_monotonic):
+        """Test that back-to-back state reads share one request until a write."""
+        state_response = CurrentStateResponse(
+            api_version="1.0",
+            id=1,
+            method="GET",
+            status="ok",
+            data=CurrentStateHolder(
+                attributes=CurrentState(enabled=True, global_brightness=70),
+                id="current_state",
+                links=Links(),
+                type="current_state",
+            ),
+        )
+        mock_request.return_value = Mock(content=json_body(state_response.to_dict()))
+        mock_monotonic.return_value = 100.0
+
+        self.assertEqual(self.client.brightness, 70)
+        self.assertTrue(self.client.enabled)
+        self.assertEqual(mock_request.call_count, 1)
+
+        self.client.brightness = 70
+        self.assertEqual(self.client.brightness, 70)
+        self.assertEqual(mock_request.call_count, 3)
+
+        mock_monotonic.return_value = 100.1
+        self.assertTrue(self.client.enabled)
+        self.assertEqual(mock_request.call_count, 4)
+
+        client = SignalRGBClient("testhost", 12345, state_ttl=0)
+        client.get_current_state()
+        client.get_current_state()
+        self.assertEqual(mock_request.call_count, 6)
+
+    @patch("requests.Session.request")
+    def test_state_snapshot_isolation(self, mock_request):
+        """Test that cached state is neither mutable by callers nor stale."""
+        state_response = CurrentStateResponse(
+            api_version="1.0",
+            id=1,
+            method="GET",
+            status="ok",
+            data=CurrentStateHolder(
+                attributes=CurrentState(enabled=True, global_brightness=70),
+                id="current_state",
+                links=Links(),
+                type="current_state",
+            ),
+        )
+        body = json_body(state_response.to_dict())
+        mock_request.return_value = Mock(content=body)
+
+        self.client.get_current_state().global_brightness = 0
+        self.assertEqual(self.client.brightness, 70)
+        self.assertEqual(mock_request.call_count, 1)
+
+        # A write landing while a read is in flight keeps that read uncached
+        def read_during_write(*args, **kwargs):
+            self.client._invalidate_state()
+            return Mock(content=body)
+
+        self.client._invalidate_state()
+        mock_request.side_effect = read_during_write
+        self.client.get_current_state()
+        mock_request.side_effect = None
+        self.client.get_current_state()
+        self.assertEqual(mock_request.call_count, 3)
+
+    @patch("requests.Session.request")
+    def test_get_current_state_public(self, mock_request):
+        """Test getting the enabled state and brightness in one request."""
+        mock_response = Mock()
+        mock_response.content = json_body(
+            {
+                "api_version": "1.0",
+                "id": 1,
+                "method": "GET",
+                "status": "ok",
+                "data": {
+                    "attributes": {
+                        "global_brightness": 80,
+                        "enabled": True,
+                        "name": "Test Effect",
+                    },
+                    "id": "current_state",
+                    "links": {},
+                    "type": "current_state",
+                },
+            }
+        )
+        mock_request.return_value = mock_response
+
+        state = self.client.get_current_state()
+        self.assertTrue(state.enabled)
+        self.assertEqual(state.global_brightness, 80)
+        mock_request.assert_called_once()
+        self.assert_request_called_with(
+            mock_request, "GET", "http://testhost:12345/api/v1/lighting"
+        )
+
     @patch("requests.Session.request")
     def test_enabled(self, mock_request):
         """Test setting and getting the enabled state."""
@@ -357,7 +502,7 @@ def test_enabled(self, mock_request):
             method="PATCH",
             status="ok",
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         self.client.enabled = True
@@ -368,18 +513,24 @@ def test_enabled(self, mock_request):
             json={"enabled": True},
         )
 
-        mock_response.json.return_value = {
-            "api_version": "1.0",
-            "id": 1,
-            "method": "GET",
-            "status": "ok",
-            "data": {
-                "attributes": {"global_brightness": 0, "enabled": True, "name": None},
-                "id": "current_state",
-                "links": {},
-                "type": "current_state",
-            },
-        }
+        mock_response.content = json_body(
+            {
+                "api_version": "1.0",
+                "id": 1,
+                "method": "GET",
+                "status": "ok",
+                "data": {
+                    "attributes": {
+                        "global_brightness": 0,
+                        "enabled": True,
+                        "name": None,
+                    },
+                    "id": "current_state",
+                    "links": {},
+                    "type": "current_state",
+                },
+            }
+        )
         enabled = self.client.enabled
         self.assertTrue(enabled)
 
@@ -393,12 +544,10 @@ def test_ensure_response_ok(self, mock_request):
             method="GET",
             status="ok",
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
-        with self.client._request_context(
-            "GET", "/api/v1/lighting/effects"
-        ) as response:
+        with self.client._request_context("GET", EFFECTS_URL) as response:
             response = SignalRGBResponse.from_dict(response)
             self.client._ensure_response_ok(response)
 
@@ -409,17 +558,26 @@ def test_ensure_response_ok(self, mock_request):
             status="error",
             errors=[Error(code="404", title="Not Found")],
         )
-        mock_response.json.return_value = error_response.to_dict()
+        mock_response.content = json_body(error_response.to_dict())
 
         with self.assertRaises(APIError) as context:
-            with self.client._request_context(
-                "GET", "/api/v1/lighting/effects"
-            ) as response_data:
+            with self.client._request_context("GET", EFFECTS_URL) as response_data:
                 response = SignalRGBResponse.from_dict(response_data)
                 self.client._ensure_response_ok(response)
 
         self.assertIn("API returned non-OK status", str(context.exception))
 
+    @patch("requests.Session.request")
+    def test_request_invalid_json(self, mock_request):
+        """Test that an unparseable response body raises an APIError."""
+        mock_request.return_value = Mock(content=b"not json")
+
+        with self.assertRaises(APIError) as context:
+            with self.client._request_context("GET", EFFECTS_URL):
+                pass
+
+        self.assertIn("Invalid JSON", str(context.exception))
+
     @patch("requests.Session.request")
     def test_request_success(self, mock_request):
         """Test a successful request."""
@@ -430,13 +588,11 @@ def test_request_success(self, mock_request):
             method="GET",
             status="ok",
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_response.raise_for_status.return_value = None
         mock_request.return_value = mock_response
 
-        with self.client._request_context(
-            "GET", "/api/v1/lighting/effects"
-        ) as response:
+        with self.client._request_context("GET", EFFECTS_URL) as response:
             self.assertEqual(response["status"], "ok")
 
     @patch("requests.Session.request")
@@ -445,7 +601,7 @@ def test_request_connection_error(self, mock_request):
         mock_request.side_effect = RequestsConnectionError("Connection failed")
 
         with self.assertRaises(ConnectionError) as context:
-            with self.client._request_context("GET", "/api/v1/lighting/effects"):
+            with self.client._request_context("GET", EFFECTS_URL):
                 pass
 
         self.assertIn("Failed to connect to SignalRGB API", str(context.exception))
@@ -456,7 +612,7 @@ def test_request_timeout(self, mock_request):
         mock_request.side_effect = Timeout("Request timed out")
 
         with self.assertRaises(ConnectionError) as context:
-            with self.client._request_context("GET", "/api/v1/lighting/effects"):
+            with self.client._request_context("GET", EFFECTS_URL):
                 pass
 
         self.assertIn("Request timed out", str(context.exception))
@@ -472,23 +628,57 @@ def test_request_http_error(self, mock_request):
             status="error",
             errors=[Error(code="404", title="Not Found")],
         )
-        mock_response.json.return_value = error_response.to_dict()
+        mock_response.content = json_body(error_response.to_dict())
         mock_response.raise_for_status.side_effect = requests.HTTPError("HTTP error")
         mock_request.return_value = mock_response
 
         with self.assertRaises(APIError) as context:
-            with self.client._request_context("GET", "/api/v1/lighting/effects"):
+            with self.client._request_context("GET", EFFECTS_URL):
                 pass
 
         self.assertIn("HTTP error occurred", str(context.exception))
 
+    @patch("requests.Session.request")
+    def test_request_http_error_non_json_body(self, mock_request):
+        """Test handling HTTP errors whose body is not JSON."""
+        error_body = Mock()
+        error_body.content = b"<html>Bad Gateway</html>"
+        mock_response = Mock()
+        mock_response.raise_for_status.side_effect = requests.HTTPError(
+            "502 Bad Gateway", response=error_body
+        )
+        mock_request.return_value = mock_response
+
+        with self.assertRaises(APIError) as context:
+            with self.client._request_context("GET", EFFECTS_URL):
+                pass
+
+        self.assertEqual(context.exception.error.title, "502 Bad Gateway")
+
+    @patch("requests.Session.request")
+    def test_request_http_error_malformed_body(self, mock_request):
+        """Test handling HTTP errors whose JSON body has no usable error."""
+        for body in (b'{"errors": []}', b'{"status": "error"}', b"[1, 2]"):
+            error_body = Mock(content=body)
+            mock_request.return_value = Mock(
+                raise_for_status=Mock(
+                    side_effect=requests.HTTPError("500 Error", response=error_body)
+                )
+            )
+
+            with self.assertRaises(APIError) as context:
+                with self.client._request_context("GET", EFFECTS_URL):
+                    pass
+
+            self.assertEqual(context.exception.error.title, "500 Error")
+
     @patch("requests.Session.request")
     def test_request_generic_error(self, mock_request):
         """Test handling generic errors in requests."""
         mock_request.side_effect = Exception("Unexpected error")
 
         with self.assertRaises(SignalRGBException) as context:
-            with self.client._request_context("GET", "/api/v1/lighting/effects"):
+            with self.client._request_context("GET", EFFECTS_URL):
                 pass
 
         self.assertIn("unexpected error", str(context.exception))
@@ -504,7 +694,7 @@ def test_get_effects_error(self, mock_request):
             status="error",
             errors=[Error(code="500", title="Internal Server Error")],
         )
-        mock_response.json.return_value = error_response.to_dict()
+        mock_response.content = json_body(error_response.to_dict())
         mock_request.return_value = mock_response
 
         with self.assertRaises(APIError) as context:
@@ -523,7 +713,7 @@ def test_get_effect_error(self, mock_request):
             status="error",
             errors=[Error(code="404", title="Not Found")],
         )
-        mock_response.json.return_value = error_response.to_dict()
+        mock_response.content = json_body(error_response.to_dict())
         mock_request.return_value = mock_response
 
         with self.assertRaises(APIError) as context:
@@ -542,7 +732,7 @@ def test_get_effect_by_name_error(self, mock_request):
             status="ok",
             data=EffectList(items=[]),
         )
-        mock_response_get_effects.json.return_value = response_get_effects.to_dict()
+        mock_response_get_effects.content = json_body(response_get_effects.to_dict())
 
         mock_request.return_value = mock_response_get_effects
 
@@ -562,7 +752,7 @@ def test_get_current_effect_error(self, mock_request):
             status="error",
             errors=[Error(code="500", title="Internal Server Error")],
         )
-        mock_response_current_state.json.return_value = error_response.to_dict()
+        mock_response_current_state.content = json_body(error_response.to_dict())
         mock_request.return_value = mock_response_current_state
 
         with self.assertRaises(APIError) as context:
@@ -581,7 +771,7 @@ def test_apply_effect_error(self, mock_request):
             status="error",
             errors=[Error(code="404", title="Not Found")],
         )
-        mock_response.json.return_value = error_response.to_dict()
+        mock_response.content = json_body(error_response.to_dict())
         mock_request.return_value = mock_response
 
         with self.assertRaises(SignalRGBException) as context:
@@ -600,7 +790,7 @@ def test_apply_effect_by_name_error(self, mock_request):
             status="ok",
             data=EffectList(items=[]),
         )
-        mock_response_get_effects.json.return_value = response_get_effects.to_dict()
+        mock_response_get_effects.content = json_body(response_get_effects.to_dict())
 
         mock_request.return_value = mock_response_get_effects
 
@@ -633,7 +823,7 @@ def test_refresh_effects(self, mock_request):
             status="ok",
             data=EffectList(items=effects1),
         )
-        mock_request.return_value = Mock(json=Mock(return_value=response1.to_dict()))
+        mock_request.return_value = Mock(content=json_body(response1.to_dict()))
 
         effects2 = [
             Effect(
@@ -657,8 +847,8 @@ def test_refresh_effects(self, mock_request):
             data=EffectList(items=effects2),
         )
         mock_request.side_effect = [
-            Mock(json=Mock(return_value=response1.to_dict())),
-            Mock(json=Mock(return_value=response2.to_dict())),
+            Mock(content=json_body(response1.to_dict())),
+            Mock(content=json_body(response2.to_dict())),
         ]
 
         effects1 = self.client.get_effects()
@@ -680,6 +870,64 @@ def test_refresh_effects(self, mock_request):
 
         self.assertEqual(mock_request.call_count, 2)
 
+    @patch("requests.Session.request")
+    def test_find_effect_uses_cached_index(self, mock_request):
+        """Test that name lookups share one effect list fetch."""
+        effects = [
+            Effect(
+                id=f"effect{i}",
+                type="lighting",
+                attributes=Attributes(name=name),
+                links=Links(),
+            )
+            for i, name in enumerate(["Rainbow", "Fire", "Rainbow"])
+        ]
+        response = EffectListResponse(
+            api_version="1.0",
+            id=1,
+            method="GET",
+            status="ok",
+            data=EffectList(items=effects),
+        )
+        mock_request.return_value = Mock(content=json_body(response.to_dict()))
+
+        self.assertEqual(self.client._find_effect("Fire").id, "effect1")
+        # The first effect wins when names are duplicated
+        self.assertEqual(self.client._find_effect("Rainbow").id, "effect0")
+        with self.assertRaises(NotFoundError):
+            self.client._find_effect("Missing")
+        self.assertEqual(mock_request.call_count, 1)
+
+    @patch("signalrgb.client.time.monotonic")
+    @patch("requests.Session.request")
+    def test_effects_cache_ttl(self, mock_request, mock_monotonic):
+        """Test that the cached effect list expires after effects_ttl seconds."""
+        response = EffectListResponse(
+            api_version="1.0",
+            id=1,
+            method="GET",
+            status="ok",
+            data=EffectList(items=[]),
+        )
+        mock_request.return_value = Mock(content=json_body(response.to_dict()))
+        client = SignalRGBClient("testhost", 12345, effects_ttl=30.0)
+
+        mock_monotonic.return_value = 100.0
+        client.get_effects()
+        mock_monotonic.return_value = 129.0
+        client.get_effects()
+        self.assertEqual(mock_request.call_count, 1)
+
+        mock_monotonic.return_value = 130.0
+        client.get_effects()
+        self.assertEqual(mock_request.call_count, 2)
+
+        client = SignalRGBClient("testhost", 12345, effects_ttl=None)
+        client.get_effects()
+        mock_monotonic.return_value = 1e9
+        client.get_effects()
+        self.assertEqual(mock_request.call_count, 3)
+
     @patch("requests.Session.request")
     def test_get_current_state(self, mock_request):
         """Test getting the current state."""
@@ -699,7 +947,7 @@ def test_get_current_state(self, mock_request):
             status="ok",
             data=current_state,
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         state = self.client._get_current_state()
@@ -725,7 +973,7 @@ def test_get_current_state_attributes(self, mock_request):
             status="ok",
             data=current_state,
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         attributes = self.client._get_current_state().attributes
@@ -748,7 +996,7 @@ def test_get_effect_presets(self, mock_request):
             status="ok",
             data=EffectPresetList(id="effect1", items=presets),
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         result = self.client.get_effect_presets("effect1")
@@ -758,6 +1006,38 @@ def test_get_effect_presets(self, mock_request):
         self.assertEqual(result[0].type, "preset")
         self.assertEqual(result[1].type, "preset")
 
+    @patch("requests.Session.request")
+    def test_get_effect_presets_bulk(self, mock_request):
+        """Test getting presets for several effects, keeping per-effect errors."""
+        ok_response = EffectPresetListResponse(
+            api_version="1.0",
+            id=1,
+            method="GET",
+            status="ok",
+            data=EffectPresetList(
+                id="effect1", items=[EffectPreset(id="preset1", type="preset")]
+            ),
+        )
+        error_response = SignalRGBResponse(
+            api_version="1.0",
+            id=2,
+            method="GET",
+            status="error",
+            errors=[Error(code="not_found", title="Not Found")],
+        )
+
+        def respond(method, url, **kwargs):
+            response = ok_response if "/effect1/" in url else error_response
+            return Mock(content=json_body(response.to_dict()))
+
+        mock_request.side_effect = respond
+
+        result = self.client.get_effect_presets_bulk(["effect1", "missing", "effect1"])
+        self.assertEqual(list(result), ["effect1", "missing"])
+        self.assertEqual(result["effect1"][0].id, "preset1")
+        self.assertIsInstance(result["missing"], NotFoundError)
+        self.assertEqual(mock_request.call_count, 2)
+
     @patch("requests.Session.request")
     def test_apply_effect_preset(self, mock_request):
         """Test applying a preset for a specific effect."""
@@ -768,7 +1048,7 @@ def test_apply_effect_preset(self, mock_request):
             method="PATCH",
             status="ok",
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         self.client.apply_effect_preset("effect1", "preset1")
@@ -779,6 +1059,40 @@ def test_apply_effect_preset(self, mock_request):
             json={"preset": "preset1"},
         )
 
+    @patch("requests.Session.request")
+    def test_apply_effect_preset_not_found(self, mock_request):
+        """Test that a not_found error names the effect and preset."""
+        response = SignalRGBResponse(
+            api_version="1.0",
+            id=1,
+            method="PATCH",
+            status="error",
+            errors=[Error(code="not_found", title="Not Found")],
+        )
+        mock_request.return_value = Mock(content=json_body(response.to_dict()))
+
+        with self.assertRaises(NotFoundError) as context:
+            self.client.apply_effect_preset("effect1", preset_id="missing")
+
+        self.assertEqual(
+            str(context.exception),
+            "Effect with ID 'effect1' or preset 'missing' not found",
+        )
+
+    @patch("requests.Session.request")
+    def test_get_next_effect_conflict(self, mock_request):
+        """Test that a 409 error means there is no next effect."""
+        response = SignalRGBResponse(
+            api_version="1.0",
+            id=1,
+            method="GET",
+            status="error",
+            errors=[Error(code="409", title="Conflict")],
+        )
+        mock_request.return_value = Mock(content=json_body(response.to_dict()))
+
+        self.assertIsNone(self.client.get_next_effect())
+
     @patch("requests.Session.request")
     def test_get_next_effect(self, mock_request):
         """Test getting the next effect in history."""
@@ -796,7 +1110,7 @@ def test_get_next_effect(self, mock_request):
             status="ok",
             data=effect,
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         next_effect = self.client.get_next_effect()
@@ -820,7 +1134,7 @@ def test_apply_next_effect(self, mock_request):
             status="ok",
             data=effect,
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         applied_effect = self.client.apply_next_effect()
@@ -844,7 +1158,7 @@ def test_get_previous_effect(self, mock_request):
             status="ok",
             data=effect,
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         previous_effect = self.client.get_previous_effect()
@@ -868,7 +1182,7 @@ def test_apply_previous_effect(self, mock_request):
             status="ok",
             data=effect,
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         applied_effect = self.client.apply_previous_effect()
@@ -892,7 +1206,7 @@ def test_apply_random_effect(self, mock_request):
             status="ok",
             data=effect,
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         random_effect = self.client.apply_random_effect()
@@ -911,7 +1225,7 @@ def test_get_current_layout(self, mock_request):
             status="ok",
             data=CurrentLayoutHolder(current_layout=layout),
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         current_layout = self.client.current_layout
@@ -930,7 +1244,7 @@ def test_set_current_layout(self, mock_request):
             status="ok",
             data=CurrentLayoutHolder(current_layout=layout),
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         self.client.current_layout = "new_layout"
@@ -954,9 +1268,9 @@ def test_get_layouts(self, mock_request):
             id=1,
             method="GET",
             status="ok",
-            data={"items": [layout.to_dict() for layout in layouts]},
+            data=LayoutList(items=layouts),
         )
-        mock_response.json.return_value = response.to_dict()
+        mock_response.content = json_body(response.to_dict())
         mock_request.return_value = mock_response
 
         result = self.client.get_layouts()
@@ -964,6 +1278,84 @@ def test_get_layouts(self, mock_request):
         self.assertEqual(result[0].id, "layout1")
         self.assertEqual(result[1].id, "layout2")
 
+    def test_session_pooling(self):
+        """Test that the default session keeps a pool of connections alive."""
+        adapter = self.client._session.get_adapter("http://testhost:12345")
+        self.assertEqual(adapter._pool_maxsize, DEFAULT_POOL_MAXSIZE)
+        self.assertEqual(self.client._session.headers["Accept"], "application/json")
+        socket_options = adapter.poolmanager.connection_pool_kw["socket_options"]
+        self.assertIn((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1), socket_options)
+        self.assertIn((socket.IPPROTO_TCP, socket.TCP_NODELAY, 1), socket_options)
+
+    def test_session_retries(self):
+        """Test that the default session retries transient failures."""
+        retry = self.client._session.get_adapter("http://testhost:12345").max_retries
+        self.assertEqual(retry.total, DEFAULT_MAX_RETRIES)
+        self.assertEqual(retry.read, 0)
+        self.assertIn(503, retry.status_forcelist)
+        self.assertIn("GET", retry.allowed_methods)
+        self.assertNotIn("POST", retry.allowed_methods)
+
+        client = SignalRGBClient("testhost", 12345, max_retries=0)
+        retry = client._session.get_adapter("http://testhost:12345").max_retries
+        self.assertEqual(retry.total, 0)
+
+    @patch("requests.Session.request")
+    def test_custom_session(self, mock_request):
+        """Test that a caller-supplied session is used for requests."""
+        session = requests.Session()
+        client = SignalRGBClient("testhost", 12345, session=session)
+        self.assertIs(client._session, session)
+
+        mock_response = Mock()
+        mock_response.content = json_body(
+            SignalRGBResponse(
+                api_version="1.0", id=1, method="POST", status="ok"
+            ).to_dict()
+        )
+        mock_request.return_value = mock_response
+
+        client.apply_effect("effect1")
+        mock_request.assert_called_once()
+
+    @patch("requests.Session.close")
+    def test_context_manager_closes_session(self, mock_close):
+        """Test that leaving the context manager closes the session."""
+        with SignalRGBClient("testhost", 12345) as client:
+            self.assertIsInstance(client, SignalRGBClient)
+            mock_close.assert_not_called()
+        mock_close.assert_called_once()
+
+    @patch("requests.Session.close")
+    def test_close_leaves_custom_session_open(self, mock_close):
+        """Test that a caller-supplied session is not closed by the client."""
+        session = requests.Session()
+        with SignalRGBClient("testhost", 12345, session=session) as client:
+            pass
+        client.close()
+        mock_close.assert_not_called()
+
+    @patch("builtins.print")
+    @patch("requests.Session.request")
+    def test_debug_flag_read_at_init(self, mock_request, mock_print):
+        """Test that SIGNALRGB_DEBUG is read once when the client is created."""
+        mock_request.return_value = Mock(
+            content=json_body(
+                SignalRGBResponse(
+                    api_version="1.0", id=1, method="POST", status="ok"
+                ).to_dict()
+            )
+        )
+        with patch.dict("os.environ", {"SIGNALRGB_DEBUG": "1"}):
+            client = SignalRGBClient("testhost", 12345)
+
+        client.apply_effect("effect1")
+        self.assertTrue(mock_print.called)
+
+        mock_print.reset_mock()
+        self.client.apply_effect("effect1")
+        mock_print.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -129,6 +129,19 @@ def test_error_model(self):
         self.assertEqual(error.title, "Internal Server Error")
         self.assertEqual(error.detail, "An unexpected error occurred")
 
+    def test_casefolded_properties(self):
+        effect = Effect(
+            id="Effect_ID",
+            type="lighting",
+            attributes=Attributes(name="Rainbow Wave", description="Bright COLORS"),
+            links=Links(),
+        )
+        self.assertEqual(effect.attributes.name_folded, "rainbow wave")
+        self.assertEqual(effect.attributes.description_folded, "bright colors")
+        self.assertEqual(Attributes(name="No Description").description_folded, "")
+        self.assertEqual(Attributes(name="Straße").name_folded, "strasse")
+        self.assertNotIn("name_folded", effect.attributes.to_dict())
+
 
 if __name__ == "__main__":
     unittest.main()